@@ -0,0 +1,164 @@
+# =============================================================================
+# collision_nb.py
+# =============================================================================
+# Numba-compiled per-frame kernel for game.py: player physics, obstacle
+# scroll, collision / landing resolution and clear bookkeeping over Game's
+# struct-of-arrays obstacle store.
+#
+# Numba is optional. Without it `njit` is a no-op, NUMBA_AVAILABLE is False
+# and Game.step() takes its NumPy path instead (step_core still imports and
+# runs as plain Python, which keeps it testable, but nothing calls it).
+# =============================================================================
+
+from __future__ import annotations
+
+import numpy as np
+
+import constants as C
+
+# Optional: Numba JIT for the headless physics + collision hot loop
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so JIT-decorated helpers still import without numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def step_core(
+    xs, ws, ys, kinds, hb_x0, hb_x1, hb_y0, hb_y1, cleared,
+    px, py, vy, last_y, on_ground, angle,
+    jump, dt, dx, start,
+    gravity, jump_vel, max_fall, ground_top, player_size, hb_margin, hb_size,
+):
+    """
+    One frame of player physics, obstacle scroll, collision resolution and
+    clear-reward bookkeeping.
+
+    Scalar equivalent of Player.jump() + Player.update() + the scroll in
+    Game.step() + Game._check_collision() + Game._mark_passed() (kept in
+    lockstep by test_physics_paths.py), operating
+    directly on Game's obstacle arrays (xs and cleared are updated in place).
+    Constants are passed in rather than read as globals so the on-disk JIT cache never goes stale when
+    constants.py changes. Rows are sorted by x, so collision only scans from
+    the `start` cursor up to the first row right of the cube.
+
+    Returns
+    -------
+    (y, vy, last_y, on_ground, angle, dead, n_cull, start, n_passed)
+        n_cull is the number of leading rows now fully off-screen; start is
+        the advanced collision cursor (before culling); n_passed is the
+        number of obstacles newly cleared this frame (0 when dead).
+    """
+    # Player.jump()
+    if jump and on_ground:
+        vy = jump_vel
+        on_ground = False
+
+    # Player.update(dt)
+    last_y = py
+    if not on_ground:
+        if vy < max_fall:
+            vy += gravity * dt
+            if vy > max_fall:
+                vy = max_fall
+        angle = (angle - 220 * dt) % 360
+    elif angle != 0.0:
+        angle = round(angle / 90.0) * 90.0
+    py += vy * dt
+    if py >= ground_top:
+        py = ground_top
+        vy = 0.0
+        on_ground = True
+        angle = 0.0
+
+    # Scroll + collision, resolved in row order
+    prev_bottom = last_y + player_size
+    px0 = int(px) + hb_margin
+    px1 = px0 + hb_size
+    py0 = int(py) + hb_margin
+    py1 = py0 + hb_size
+    supported = False
+    n = xs.shape[0]
+    # Scroll, counting the off-screen prefix to cull and advancing the
+    # collision cursor past rows the player has cleared, in the same pass.
+    n_cull = 0
+    first = start
+    for i in range(n):
+        xs[i] -= dx
+        if i == n_cull and xs[i] + ws[i] < 0:
+            n_cull += 1
+    while start < n and xs[start] + ws[start] < px:
+        start += 1
+
+    for i in range(start, n):
+        if xs[i] > px + player_size:
+            break
+        if xs[i] + ws[i] < px:
+            continue
+        ix = int(xs[i])
+        if (ix + hb_x0[i] < px1 and ix + hb_x1[i] > px0
+                and hb_y0[i] < py1 and hb_y1[i] > py0):
+            if kinds[i] == 0:             # _KIND_SPIKE
+                return py, vy, last_y, on_ground, angle, True, n_cull, start, 0
+            if vy >= 0 and prev_bottom <= ys[i] + 8:
+                py = ys[i] - player_size
+                vy = 0.0
+                on_ground = True
+                angle = 0.0
+                supported = True
+                py0 = int(py) + hb_margin
+                py1 = py0 + hb_size
+            else:
+                return py, vy, last_y, on_ground, angle, True, n_cull, start, 0
+        # Flush on a block top without overlapping its kill zone. The break /
+        # continue above already guarantee the row spans the player in x.
+        elif (not supported and kinds[i] == 1   # _KIND_BLOCK
+                and abs(py + player_size - ys[i]) < 2):
+            supported = True
+
+    if not supported and py < ground_top:
+        on_ground = False
+
+    # Rows before the previous cursor were cleared when they were passed, and
+    # rows starting right of the player cannot have been passed yet.
+    n_passed = 0
+    for i in range(first, n):
+        if xs[i] > px:
+            break
+        if not cleared[i] and xs[i] + ws[i] < px:
+            cleared[i] = True
+            n_passed += 1
+    return py, vy, last_y, on_ground, angle, False, n_cull, start, n_passed
+
+
+_warmed = False
+
+
+def warm_up() -> None:
+    """
+    Compile (or load from the on-disk cache) step_core before the first real
+    frame, so a training run doesn't pay the JIT cost inside its first step.
+    Argument types mirror Game.step()'s call so the same specialisation is
+    reused. Runs at most once per process; a no-op without numba.
+    """
+    global _warmed
+    if _warmed or not NUMBA_AVAILABLE:
+        return
+    _warmed = True
+    i64 = np.zeros(1, dtype=np.int64)
+    step_core(
+        np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.uint8),
+        i64, i64.copy(), i64.copy(), i64.copy(), np.zeros(1, dtype=np.bool_),
+        float(C.PLAYER_X), 0.0, 0.0, 0.0, True, 0.0,
+        False, 1.0 / C.FPS, 0.0, 0,
+        C.GRAVITY, C.JUMP_VEL, C.MAX_FALL_SPEED,
+        float(C.GROUND_Y - C.PLAYER_SIZE), C.PLAYER_SIZE, C.HITBOX_MARGIN,
+        C.PLAYER_SIZE - 2 * C.HITBOX_MARGIN,
+    )
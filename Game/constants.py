@@ -109,6 +109,11 @@ SPIKE_H      = BLOCK_SIZE   # px — height of a spike      (= 30)
 BLOCK_W      = BLOCK_SIZE   # px — width  of a solid block (= 30)
 BLOCK_H      = BLOCK_SIZE   # px — height of a solid block (= 30)
 
+# Top edge (y) of an obstacle resting directly on the ground. Derived once here
+# so hitbox / obs / draw code never has to recompute it per frame.
+SPIKE_TOP_Y  = GROUND_Y - SPIKE_H
+BLOCK_TOP_Y  = GROUND_Y - BLOCK_H
+
 # Spike hitbox tuning.
 # Horizontal: hitbox stays centered on the spike and uses this fraction of width.
 # Vertical: top and bottom insets are controlled independently so the kill zone
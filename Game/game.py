@@ -28,6 +28,7 @@
 #
 #   g = Game(render=False, seed=42)   # headless — no window, runs fast
 #   obs = g.reset()                   # returns a dict of game state
+#                                     # (obs_mode="array" → reused float32 vector)
 #
 #   while True:
 #       action = 1 if your_agent_decides_to_jump(obs) else 0
@@ -35,6 +36,12 @@
 #       if done:
 #           obs = g.reset()
 #
+#   Many worlds at once (batched, auto-resetting, array observations):
+#
+#   vg  = VecGame(8, seed=42)         # env i uses seed 42 + i
+#   obs = vg.reset()                  # (8, 28) float32
+#   obs, rewards, dones, infos = vg.step(actions)   # SB3 VecEnv-style
+#
 # ── OBS DICT (Fixed-Size for Neural Networks) ────────────────────────────────
 #
 #   To feed this state into standard RL libraries (SB3, RLlib), the observation
@@ -62,15 +69,17 @@
 from __future__ import annotations
 
 import argparse
-import random
 import sys
+from collections import deque
+from itertools import islice
 from typing import Optional
 from pathlib import Path
 
-import pygame
+import numpy as np
 
 import constants as C
 from level_generator import LevelGenerator
+from collision_nb import NUMBA_AVAILABLE, step_core, warm_up
 
 # Optional: import RL model for AI agent mode
 try:
@@ -82,6 +91,77 @@ except ImportError:
     SimplePolicyNetwork = None
     torch = None
 
+# Optional: pygame is only needed for drawing and for the Rect-backed hitbox /
+# obstacle objects. Headless training (render=False, array observations) never
+# touches it, so worker processes can run without importing it at all.
+try:
+    import pygame
+    PYGAME_AVAILABLE = True
+except ImportError:
+    PYGAME_AVAILABLE = False
+    pygame = None
+
+# Hot-path aliases of derived constants. Bound once at import so per-frame code
+# (and default-arg binding in Player.update) avoids repeated C.<NAME> lookups.
+_GRAVITY        = C.GRAVITY
+_JUMP_VEL       = C.JUMP_VEL
+_MAX_FALL_SPEED = C.MAX_FALL_SPEED
+_GAME_SPEED     = C.GAME_SPEED
+_PLAYER_SIZE    = C.PLAYER_SIZE
+_PLAYER_X       = C.PLAYER_X
+_HITBOX_MARGIN  = C.HITBOX_MARGIN
+_REWARD_ALIVE   = C.REWARD_ALIVE
+_REWARD_DEATH   = C.REWARD_DEATH
+_REWARD_CLEAR   = C.REWARD_CLEAR
+_GROUND_TOP     = float(C.GROUND_Y - C.PLAYER_SIZE)   # player y when resting on the floor
+_FPS_DT         = 1.0 / C.FPS
+_SPAWN_HORIZON  = C.SCREEN_W + C.GAP_MAX              # spawn once the next slot is this close
+
+# The player never moves horizontally, so its kill-zone x span is a constant.
+_PLAYER_HB_SIZE = C.PLAYER_SIZE - 2 * C.HITBOX_MARGIN
+_PLAYER_HB_X0   = int(C.PLAYER_X) + C.HITBOX_MARGIN
+_PLAYER_HB_X1   = _PLAYER_HB_X0 + _PLAYER_HB_SIZE
+
+# Numeric obstacle kinds used by Game's struct-of-arrays obstacle store (and
+# emitted as the observation "type" feature). _KIND_NAMES maps them back to
+# the level-dict "type" / Spike.kind / Block.kind strings.
+_KIND_SPIKE = 0
+_KIND_BLOCK = 1
+_KIND_NAMES = ("spike", "block")
+_KIND_BY_NAME = {name: kind for kind, name in enumerate(_KIND_NAMES)}
+
+# Procedural spawns draw gaps / kinds from NumPy in batches of this size.
+_RNG_BATCH = 1024
+
+# Spike kill-zone fractions, clamped the same way Spike.__init__ does.
+_SPIKE_HB_WIDTH_FRAC        = max(0.01, min(1.0, C.SPIKE_HITBOX_WIDTH_FRAC))
+_SPIKE_HB_TOP_INSET_FRAC    = max(0.0, min(1.0, C.SPIKE_HITBOX_TOP_INSET_FRAC))
+_SPIKE_HB_BOTTOM_INSET_FRAC = max(0.0, min(1.0, C.SPIKE_HITBOX_BOTTOM_INSET_FRAC))
+
+# Fixed-size observation layout: features per obstacle [type, x, y, w, h].
+_OBS_MAX_OBSTACLES = 5
+_OBS_FEATURES      = 5
+_OBS_DIM           = 3 + _OBS_MAX_OBSTACLES * _OBS_FEATURES   # obs_mode="array" length
+
+# Player sprite rotation LUT granularity (degrees). The cube rolls visibly,
+# not precisely, so 36 pre-rotated frames are indistinguishable from exact.
+_SPRITE_ANGLE_STEP = 10
+
+# Transparent border around pre-rendered obstacle sprites so thick outlines
+# that spill past the shape's bounds are not clipped.
+_SPRITE_PAD = 2
+
+
+def _display_format(surf: pygame.Surface) -> pygame.Surface:
+    """
+    Convert an SRCALPHA sprite to the display's pixel format so blits take
+    SDL's fast same-format path. Sprites built before a window exists (or
+    headless) are returned unchanged.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha()
+
 
 def _set_windows_dpi_awareness() -> None:
     """Best-effort DPI awareness so window sizes map to physical pixels on Windows."""
@@ -127,13 +207,22 @@ class Player:
     angle      : float   Visual rotation angle in degrees (cosmetic only).
     """
 
+    # No per-instance __dict__: attribute access on the hot path is a slot load
+    __slots__ = ("x", "y", "last_y", "vy", "on_ground", "alive", "angle", "_hitbox")
+
+    # Pre-rendered cube sprite + rotations, built on first draw (see _rotated_sprites)
+    _base_sq: Optional[pygame.Surface] = None
+    _rotated: Optional[list[pygame.Surface]] = None
+    _rotated_half: list[tuple[int, int]] = []
+
     def __init__(self) -> None:
+        self._hitbox: Optional[pygame.Rect] = None   # created on first .hitbox access
         self.reset()
 
     def reset(self) -> None:
         """Put the player back at the start position and reset physics state."""
         self.x        : float = float(C.PLAYER_X)
-        self.y        : float = float(C.GROUND_Y - C.PLAYER_SIZE)
+        self.y        : float = _GROUND_TOP
         self.last_y   : float = self.y  
         self.vy       : float = 0.0
         self.on_ground: bool  = True
@@ -148,15 +237,24 @@ class Player:
         Ignored while airborne (no double-jump in basic cube mode).
         """
         if self.on_ground:
-            self.vy = C.JUMP_VEL      
+            self.vy = _JUMP_VEL
             self.on_ground = False
 
     # ── Physics update ────────────────────────────────────────────────────────
 
-    def update(self, dt: float) -> None:
+    def update(
+        self,
+        dt   : float,
+        _g   : float = _GRAVITY,
+        _vmax: float = _MAX_FALL_SPEED,
+        _gt  : float = _GROUND_TOP,
+    ) -> None:
         """
         Advance player physics by dt seconds.
         Called once per frame from Game.step().
+
+        The underscore keyword arguments are constants bound at definition time
+        (fast local lookups) — callers should never pass them.
         """
         if not self.alive:
             return
@@ -166,22 +264,22 @@ class Player:
 
         # Only apply gravity and spin if we are actually falling/jumping
         if not self.on_ground:
-            if self.vy < C.MAX_FALL_SPEED:
-                self.vy += C.GRAVITY * dt
-                if self.vy > C.MAX_FALL_SPEED:
-                    self.vy = C.MAX_FALL_SPEED
+            if self.vy < _vmax:
+                self.vy += _g * dt
+                if self.vy > _vmax:
+                    self.vy = _vmax
             self.angle = (self.angle - 220 * dt) % 360
-        else:
-            # Snap angle nicely to the nearest 90 degrees when sliding on a block
+        elif self.angle:
+            # Snap angle nicely to the nearest 90 degrees when sliding on a block.
+            # Every landing already zeroes the angle, so this rarely runs.
             self.angle = round(self.angle / 90.0) * 90.0
 
         # Move vertically
         self.y += self.vy * dt
 
         # Main floor collision clamp
-        ground_top = float(C.GROUND_Y - C.PLAYER_SIZE)
-        if self.y >= ground_top:
-            self.y         = ground_top
+        if self.y >= _gt:
+            self.y         = _gt
             self.vy        = 0.0
             self.on_ground = True
             self.angle     = 0.0
@@ -194,33 +292,58 @@ class Player:
         The actual collision rectangle used for death detection.
         Slightly smaller than the visual cube (HITBOX_MARGIN px inward on all sides).
         Matches the forgiving nature of real GD hitboxes.
+
+        The same Rect is reused and re-synced to the current position on
+        every access (y is also written by Game's step kernel directly).
         """
-        m = C.HITBOX_MARGIN
-        return pygame.Rect(
-            int(self.x) + m,
-            int(self.y) + m,
-            C.PLAYER_SIZE - 2 * m,
-            C.PLAYER_SIZE - 2 * m,
-        )
+        m = _HITBOX_MARGIN
+        if self._hitbox is None:
+            self._hitbox = pygame.Rect(0, 0, _PLAYER_HB_SIZE, _PLAYER_HB_SIZE)
+        self._hitbox.update(int(self.x) + m, int(self.y) + m, _PLAYER_HB_SIZE, _PLAYER_HB_SIZE)
+        return self._hitbox
 
     # ── Rendering ─────────────────────────────────────────────────────────────
 
+    @classmethod
+    def _rotated_sprites(cls) -> list[pygame.Surface]:
+        """
+        Lazily build the cube sprite and its rotation lookup table.
+        Shared by all players and only built on first draw, so headless
+        training never allocates any surfaces. Frames are converted to the
+        display's pixel format when a window exists (fast-path blits), and
+        each frame's half-size is kept so draw needn't build a centre Rect.
+        """
+        if cls._rotated is None:
+            sq = pygame.Surface((C.PLAYER_SIZE, C.PLAYER_SIZE), pygame.SRCALPHA)
+            pygame.draw.rect(sq, C.PLAYER_COLOR, sq.get_rect(), border_radius=4)
+            pygame.draw.line(sq, (255, 255, 255, 160), (4, 4), (C.PLAYER_SIZE - 4, C.PLAYER_SIZE - 4), 2)
+            pygame.draw.line(sq, (255, 255, 255, 160), (C.PLAYER_SIZE - 4, 4), (4, C.PLAYER_SIZE - 4), 2)
+            rotated = [pygame.transform.rotate(sq, a) for a in range(0, 360, _SPRITE_ANGLE_STEP)]
+            sq = _display_format(sq)
+            rotated = [_display_format(r) for r in rotated]
+            cls._base_sq = sq
+            cls._rotated_half = [(r.get_width() // 2, r.get_height() // 2) for r in rotated]
+            cls._rotated = rotated
+        return cls._rotated
+
     def draw(self, surface: pygame.Surface, debug: bool = False) -> None:
         """Renders the player cube to the provided surface."""
         if not self.alive:
             return
 
-        cx = int(self.x) + C.PLAYER_SIZE // 2
-        cy = int(self.y) + C.PLAYER_SIZE // 2
-
-        # Draw rotated cube onto a temp surface, then blit to screen
-        sq = pygame.Surface((C.PLAYER_SIZE, C.PLAYER_SIZE), pygame.SRCALPHA)
-        pygame.draw.rect(sq, C.PLAYER_COLOR, sq.get_rect(), border_radius=4)
-        pygame.draw.line(sq, (255, 255, 255, 160), (4, 4), (C.PLAYER_SIZE - 4, C.PLAYER_SIZE - 4), 2)
-        pygame.draw.line(sq, (255, 255, 255, 160), (C.PLAYER_SIZE - 4, 4), (4, C.PLAYER_SIZE - 4), 2)
+        # Grounded (or upright) cubes need no rotation at all — the art is
+        # symmetric under quarter turns, so blit the base square directly.
+        sprites = self._rotated_sprites()
+        if self.on_ground or abs(self.angle) < 1.0:
+            surface.blit(Player._base_sq, (int(self.x), int(self.y)))
+        else:
+            cx = int(self.x) + C.PLAYER_SIZE // 2
+            cy = int(self.y) + C.PLAYER_SIZE // 2
 
-        rotated = pygame.transform.rotate(sq, self.angle)
-        surface.blit(rotated, rotated.get_rect(center=(cx, cy)))
+            # The cube art never changes, only its angle — blit a pre-rotated frame
+            idx = int(self.angle // _SPRITE_ANGLE_STEP) % len(sprites)
+            hw, hh = Player._rotated_half[idx]
+            surface.blit(sprites[idx], (cx - hw, cy - hh))
 
         if debug:
             pygame.draw.rect(surface, (255, 255, 0), self.hitbox, 1)
@@ -238,32 +361,73 @@ class Spike:
     where the outer edges of the spike silhouette are non-lethal.
     Kill zone = inner (1 - 2×SPIKE_HITBOX_MARGIN) fraction of the base width.
     """
-    kind = "spike"
-
-    def __init__(self, x: float) -> None:
-        self.x = x                  
-        self.w = float(C.SPIKE_W)   
-        self.h = float(C.SPIKE_H)
-        self._y = float(C.GROUND_Y - self.h)
-
-    def update(self, dx: float) -> None:
-        """Scroll left by dx pixels."""
-        self.x -= dx
+    kind = _KIND_NAMES[_KIND_SPIKE]
+    __slots__ = ("x", "w", "h", "_y", "_rect", "_margin", "_tip_y", "_tip_dx", "_pool")
+
+    # Pre-rendered triangles keyed by (base width, tip offset, height), built on first draw
+    _sprites: dict[tuple[int, int, int], pygame.Surface] = {}
+
+    def __init__(
+        self,
+        x: float,
+        y: Optional[float] = None,
+        w: Optional[float] = None,
+        h: Optional[float] = None,
+    ) -> None:
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        self._pool: Optional[list[Spike]] = None
+        self._setup(x, y, w, h)
+
+    @classmethod
+    def acquire(
+        cls,
+        pool: list[Spike],
+        x: float,
+        y: Optional[float] = None,
+        w: Optional[float] = None,
+        h: Optional[float] = None,
+    ) -> Spike:
+        """
+        Like Spike(x, y, w, h), but recycles a released spike from `pool`
+        (a free-list owned by one Game) when it holds one.
+        """
+        if pool:
+            spike = pool.pop()
+            spike._setup(x, y, w, h)
+            return spike
+        spike = cls(x, y, w, h)
+        spike._pool = pool
+        return spike
+
+    def release(self) -> None:
+        """Return this spike to the pool it came from. The caller must not use it afterwards."""
+        if self._pool is not None:
+            self._pool.append(self)
+
+    def _setup(
+        self,
+        x: float,
+        y: Optional[float],
+        w: Optional[float],
+        h: Optional[float],
+    ) -> None:
+        """(Re)initialise geometry; shared by __init__ and acquire()."""
+        self.x = x
+        self.w = float(w) if w is not None else float(C.SPIKE_W)
+        self.h = float(h) if h is not None else float(C.SPIKE_H)
+        if y is not None:
+            self._y = float(y)
+        else:
+            self._y = float(C.SPIKE_TOP_Y) if h is None else float(C.GROUND_Y - self.h)
 
-    @property
-    def offscreen(self) -> bool:
-        """True when fully off the left edge — safe to remove from memory."""
-        return self.x + self.w < 0
-
-    @property
-    def hitbox(self) -> pygame.Rect:
-        """Rectangle kill zone with centered width and independent vertical insets."""
-        width_frac = max(0.01, min(1.0, C.SPIKE_HITBOX_WIDTH_FRAC))
-        top_inset_frac = max(0.0, min(1.0, C.SPIKE_HITBOX_TOP_INSET_FRAC))
-        bottom_inset_frac = max(0.0, min(1.0, C.SPIKE_HITBOX_BOTTOM_INSET_FRAC))
+        # The kill zone only ever moves horizontally, so set it up once and
+        # slide it in update() instead of allocating a new Rect per access.
+        width_frac = _SPIKE_HB_WIDTH_FRAC
+        top_inset_frac = _SPIKE_HB_TOP_INSET_FRAC
+        bottom_inset_frac = _SPIKE_HB_BOTTOM_INSET_FRAC
 
         # Keep hitbox centered horizontally while allowing exact width control.
-        margin_x = int(self.w * (1.0 - width_frac) * 0.5)
+        self._margin = int(self.w * (1.0 - width_frac) * 0.5)
         hitbox_w = max(1, int(self.w * width_frac))
 
         # Allow independent top/bottom control (not vertically centered by default).
@@ -271,21 +435,63 @@ class Spike:
         inset_bottom = int(self.h * bottom_inset_frac)
         hitbox_h = max(1, int(self.h - inset_top - inset_bottom))
 
-        return pygame.Rect(
-            int(self.x) + margin_x,
+        self._rect.update(
+            int(self.x) + self._margin,
             int(self._y) + inset_top,
             hitbox_w,
             hitbox_h,
         )
 
+        # Static pixel geometry of the drawn triangle (only x scrolls)
+        self._tip_y  = int(self._y)
+        self._tip_dx = int(self.w) // 2
+
+    def update(self, dx: float) -> None:
+        """Scroll left by dx pixels."""
+        self.x -= dx
+        self._rect.x = int(self.x) + self._margin
+
+    def set_x(self, x: float, ix: Optional[int] = None) -> None:
+        """
+        Jump straight to screen x (used when syncing from Game's obstacle arrays).
+        `ix` is int(x) when the caller has already truncated it in bulk.
+        """
+        self.x = x
+        self._rect.x = (int(x) if ix is None else ix) + self._margin
+
+    @property
+    def offscreen(self) -> bool:
+        """True when fully off the left edge — safe to remove from memory."""
+        return self.x + self.w < 0
+
+    @property
+    def hitbox(self) -> pygame.Rect:
+        """Rectangle kill zone with centered width and independent vertical insets."""
+        return self._rect
+
+    @staticmethod
+    def _render_sprite(base_w: int, tip_dx: int, height: int) -> pygame.Surface:
+        """Rasterise one spike triangle (fill + outline) onto a padded transparent surface."""
+        p    = _SPRITE_PAD
+        surf = pygame.Surface((base_w + 2 * p + 1, height + 2 * p + 1), pygame.SRCALPHA)
+        bl, br, tip = (p, p + height), (p + base_w, p + height), (p + tip_dx, p)
+        pygame.draw.polygon(surf, C.SPIKE_COLOR, [bl, br, tip])
+        pygame.draw.polygon(surf, (255, 130, 130), [bl, br, tip], 2)
+        return _display_format(surf)
+
+    def blit_args(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """(sprite, position) for this spike, ready for Surface.blit / blits."""
+        x0    = self._rect.x - self._margin   # int(self.x), kept in sync by update()/set_x()
+        tip_y = self._tip_y
+        key   = (int(self.x + self.w) - x0, self._tip_dx, C.GROUND_Y - tip_y)
+        sprite = Spike._sprites.get(key)
+        if sprite is None:
+            sprite = Spike._sprites[key] = Spike._render_sprite(*key)
+        return sprite, (x0 - _SPRITE_PAD, tip_y - _SPRITE_PAD)
+
     def draw(self, surface: pygame.Surface, debug: bool = False) -> None:
         """Renders the spike triangle and optional debug bounding box."""
-        tip_x = int(self.x) + int(self.w) // 2
-        tip_y = int(self._y)
-        bl    = (int(self.x),          C.GROUND_Y)
-        br    = (int(self.x + self.w), C.GROUND_Y)
-        pygame.draw.polygon(surface, C.SPIKE_COLOR, [bl, br, (tip_x, tip_y)])
-        pygame.draw.polygon(surface, (255, 130, 130), [bl, br, (tip_x, tip_y)], 2)
+        surface.blit(*self.blit_args())
 
         if debug:
             pygame.draw.rect(surface, (255, 255, 0), self.hitbox, 1)
@@ -301,17 +507,65 @@ class Block:
     Hitting the sides or bottom is lethal.
     Landing on the top acts as a new floor surface for the player.
     """
-    kind = "block"
+    kind = _KIND_NAMES[_KIND_BLOCK]
+    __slots__ = ("x", "w", "h", "_y", "_rect", "_pool")
+
+    # Pre-rendered block art keyed by (w, h), built on first draw
+    _sprites: dict[tuple[int, int], pygame.Surface] = {}
 
     def __init__(self, x: float, y: Optional[float] = None, h: Optional[float] = None) -> None:
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        self._pool: Optional[list[Block]] = None
+        self._setup(x, y, h)
+
+    @classmethod
+    def acquire(
+        cls,
+        pool: list[Block],
+        x: float,
+        y: Optional[float] = None,
+        h: Optional[float] = None,
+    ) -> Block:
+        """
+        Like Block(x, y, h), but recycles a released block from `pool`
+        (a free-list owned by one Game) when it holds one.
+        """
+        if pool:
+            block = pool.pop()
+            block._setup(x, y, h)
+            return block
+        block = cls(x, y, h)
+        block._pool = pool
+        return block
+
+    def release(self) -> None:
+        """Return this block to the pool it came from. The caller must not use it afterwards."""
+        if self._pool is not None:
+            self._pool.append(self)
+
+    def _setup(self, x: float, y: Optional[float], h: Optional[float]) -> None:
+        """(Re)initialise geometry; shared by __init__ and acquire()."""
         self.x = x
         self.w = float(C.BLOCK_W)
         self.h = float(h) if h is not None else float(C.BLOCK_H)
-        self._y = float(y) if y is not None else float(C.GROUND_Y - self.h)
+        if y is not None:
+            self._y = float(y)
+        else:
+            self._y = float(C.BLOCK_TOP_Y) if h is None else float(C.GROUND_Y - self.h)
+        self._rect.update(int(self.x), int(self._y), int(self.w), int(self.h))
 
     def update(self, dx: float) -> None:
         """Scroll left by dx pixels."""
         self.x -= dx
+        self._rect.x = int(self.x)
+
+    def set_x(self, x: float, ix: Optional[int] = None) -> None:
+        """
+        Jump straight to screen x (used when syncing from Game's obstacle arrays).
+        `ix` is int(x) when the caller has already truncated it in bulk.
+        """
+        self.x = x
+        self._rect.x = int(x) if ix is None else ix
 
     @property
     def offscreen(self) -> bool:
@@ -320,16 +574,32 @@ class Block:
 
     @property
     def hitbox(self) -> pygame.Rect:
-        """Full rectangle — no margin."""
-        return pygame.Rect(int(self.x), int(self._y), int(self.w), int(self.h))
+        """Full rectangle — no margin. Kept in sync with x by update()."""
+        return self._rect
+
+    @staticmethod
+    def _render_sprite(w: int, h: int) -> pygame.Surface:
+        """Rasterise the block art (fill, border, cross) onto a padded transparent surface."""
+        p    = _SPRITE_PAD
+        surf = pygame.Surface((w + 2 * p + 1, h + 2 * p + 1), pygame.SRCALPHA)
+        r    = pygame.Rect(p, p, w, h)
+        pygame.draw.rect(surf, C.BLOCK_COLOR, r, border_radius=3)
+        pygame.draw.rect(surf, (140, 255, 170), r, 2, border_radius=3)
+        pygame.draw.line(surf, (80, 180, 100), (r.left, r.centery), (r.right, r.centery), 1)
+        pygame.draw.line(surf, (80, 180, 100), (r.centerx, r.top), (r.centerx, r.bottom), 1)
+        return _display_format(surf)
+
+    def blit_args(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """(sprite, position) for this block, ready for Surface.blit / blits."""
+        r = self._rect
+        sprite = Block._sprites.get(r.size)
+        if sprite is None:
+            sprite = Block._sprites[r.size] = Block._render_sprite(*r.size)
+        return sprite, (r.x - _SPRITE_PAD, r.y - _SPRITE_PAD)
 
     def draw(self, surface: pygame.Surface, debug: bool = False) -> None:
         """Renders the solid block with visual styling."""
-        r = self.hitbox
-        pygame.draw.rect(surface, C.BLOCK_COLOR, r, border_radius=3)
-        pygame.draw.rect(surface, (140, 255, 170), r, 2, border_radius=3)
-        pygame.draw.line(surface, (80, 180, 100), (r.left, r.centery), (r.right, r.centery), 1)
-        pygame.draw.line(surface, (80, 180, 100), (r.centerx, r.top), (r.centerx, r.bottom), 1)
+        surface.blit(*self.blit_args())
         if debug:
             pygame.draw.rect(surface, (255, 255, 0), self.hitbox, 1)
 
@@ -350,13 +620,37 @@ class Game:
         Random seed for obstacle generation. Same seed = same level layout.
     debug : bool
         Show hitbox outlines (yellow rectangles).
+    obs_mode : str
+        "dict" (default) returns the observation dict described at the top of
+        this file. "array" returns a preallocated float32 vector with the same
+        contents — [player_y, player_vy, on_ground, *obstacles] — refilled in
+        place every step (copy it if you need to keep it). Meant for RL loops
+        that would convert the dict straight into an array anyway.
+    obs_out : np.ndarray | None
+        With obs_mode="array", the float32 vector of shape (OBS_DIM,) to fill
+        in place instead of an internal one — e.g. a row of a batch matrix
+        (see VecGame). Every step and reset writes into it and returns it.
     """
 
-    def __init__(self, render: bool = True, seed: Optional[int] = None, debug: bool = False, agent_policy: Optional = None) -> None:
+    # Length of the obs_mode="array" observation vector
+    OBS_DIM = _OBS_DIM
+
+    def __init__(self, render: bool = True, seed: Optional[int] = None, debug: bool = False, agent_policy: Optional = None, obs_mode: str = "dict", obs_out: Optional[np.ndarray] = None) -> None:
+        if obs_mode not in ("dict", "array"):
+            raise ValueError(f"obs_mode must be 'dict' or 'array', got {obs_mode!r}")
+        if obs_out is None:
+            obs_out = np.zeros(_OBS_DIM, dtype=np.float32)
+        elif obs_mode != "array":
+            raise ValueError("obs_out requires obs_mode='array'")
+        elif obs_out.shape != (_OBS_DIM,) or obs_out.dtype != np.float32:
+            raise ValueError(f"obs_out must be a float32 array of shape ({_OBS_DIM},), "
+                             f"got {obs_out.dtype} {obs_out.shape}")
+        self._obs_mode  = obs_mode
+        self._obs_arr   = obs_out
         self._do_render = render
         self._seed      = seed
         self._debug     = debug
-        self._rng       = random.Random(seed)
+        self._seed_rng(seed)
         self._telemetry_enabled: bool = False
         self._telemetry_obs: dict = {}
         self._telemetry_reward: float = 0.0
@@ -370,25 +664,50 @@ class Game:
         self._agent_confidence: float = 0.0
 
         self.player    = Player()
-        self.obstacles : list[Spike | Block] = []
         self._scroll_x : float = 0.0
         self._step_n   : int   = 0
         self._next_x   : float = 0.0
         self._fixed_level     : bool = False
         self._level_dicts     : list = []
-        self._cleared_obstacles : set = set()
+        self._level_rows      : Optional[dict[str, np.ndarray]] = None
+
+        # Obstacles live in a struct-of-arrays store: one NumPy array per field,
+        # row i describing obstacle i (rows stay in insertion = x-sorted order).
+        # Scrolling, culling, collision and observations all operate on these
+        # arrays; Spike/Block objects are only built (lazily, via the
+        # `obstacles` property) when something renders or inspects them.
+        # Rows are kept sorted by x; `_collision_idx` is a cursor on the first
+        # row not yet fully passed by the player (everything before it is behind).
+        self._obstacle_objs : Optional[deque[Spike | Block]] = None
+        # Bumped whenever the arrays scroll; the object view only re-syncs its
+        # positions when this moved since its last sync.
+        self._obs_version   : int = 0
+        self._objs_version  : int = -1
+        # Free-lists of released objects, private to this game: objects a
+        # caller got from `obstacles` are only ever recycled by the same game.
+        self._spike_pool : list[Spike] = []
+        self._block_pool : list[Block] = []
+        self._clear_obstacles()
 
         self.surface : Optional[pygame.Surface]     = None
         self.clock   : Optional[pygame.time.Clock]  = None
         self.font    : Optional[pygame.font.Font]   = None
+        self._bg_cached    : Optional[pygame.Surface] = None
+        self._ground_panel : Optional[pygame.Surface] = None
+        self._hud_text     : dict[str, pygame.Surface] = {}   # rendered HUD lines, by exact text
 
         if render:
             self._init_display()
 
+        warm_up()
         self._spawn_initial()
+        if obs_mode == "array":
+            self._obs_array()   # obs_out holds a valid observation from the start
 
     def _init_display(self) -> None:
         """Initialise pygame window, clock, and HUD font."""
+        if not PYGAME_AVAILABLE:
+            raise ImportError("pygame is required for render=True. Install with: pip install pygame")
         _set_windows_dpi_awareness()
         if not pygame.get_init():
             pygame.init()
@@ -397,6 +716,7 @@ class Game:
         pygame.display.set_caption(C.WINDOW_TITLE)
         self.clock   = pygame.time.Clock()
         self.font    = pygame.font.SysFont("monospace", 15, bold=True)
+        self._build_static_layers()
 
     def reset(self, seed: Optional[int] = None) -> dict:
         """
@@ -404,51 +724,41 @@ class Game:
         Returns the initial fixed-size observation dict.
         """
         if seed is not None:
-            self._rng = random.Random(seed)
+            self._seed_rng(seed)
         elif self._seed is not None:
-            self._rng = random.Random(self._seed)
+            self._seed_rng(self._seed)
 
         self.player.reset()
-        self.obstacles.clear()
-        self._cleared_obstacles.clear()
         self._scroll_x = 0.0
         self._step_n   = 0
         self._next_x   = float(C.SPAWN_X)
 
-        if self._fixed_level and self._level_dicts:
-            self.obstacles = []
-            for d in self._level_dicts:
-                if d["type"] == "spike":
-                    s = Spike(d["x"]); s.w = d["w"]; s.h = d["h"]; s._y = d.get("y", C.GROUND_Y - s.h)
-                    self.obstacles.append(s)
-                else:
-                    self.obstacles.append(Block(d["x"], y=d["y"], h=d["h"]))
+        if self._fixed_level and len(self._level_dicts):
+            self._set_obstacles(self._level_rows)
         else:
+            self._clear_obstacles()
             self._spawn_initial()
-        return self._obs()
+        return self._current_obs()
 
-    def load_level(self, obstacle_dicts: list[dict]) -> dict:
+    def load_level(self, obstacle_dicts: list[dict] | np.ndarray) -> dict:
         """
-        Load a pre-generated level from a list of obstacle dicts.
+        Load a pre-generated level from a list of obstacle dicts, or from the
+        packed record array of LevelGenerator.generate_array().
         Locks the environment into fixed-level mode (disables procedural generation).
         """
         self.player.reset()
         self._scroll_x = 0.0
         self._step_n   = 0
 
-        self.obstacles = []
-        for d in obstacle_dicts:
-            if d["type"] == "spike":
-                s = Spike(d["x"]); s.w = d["w"]; s.h = d["h"]; s._y = d.get("y", C.GROUND_Y - s.h)
-                self.obstacles.append(s)
-            elif d["type"] == "block":
-                self.obstacles.append(Block(d["x"], y=d["y"], h=d["h"]))
+        self._level_rows = self._build_level_obstacles(obstacle_dicts)
+        self._set_obstacles(self._level_rows)
 
         self._fixed_level = True
-        self._level_dicts = list(obstacle_dicts)   
-        return self._obs()
+        self._level_dicts = (obstacle_dicts.copy() if isinstance(obstacle_dicts, np.ndarray)
+                             else list(obstacle_dicts))
+        return self._current_obs()
 
-    def step(self, action: int, dt: float = 1.0 / C.FPS) -> tuple[dict, float, bool]:
+    def step(self, action: int, dt: float = _FPS_DT) -> tuple[dict | np.ndarray, float, bool]:
         """
         Advance the simulation by one timestep.
 
@@ -461,7 +771,9 @@ class Game:
 
         Returns
         -------
-        obs    : dict    Fixed-shape current game state.
+        obs    : dict | np.ndarray
+                         Fixed-shape current game state: a dict, or with
+                         obs_mode="array" the reused float32 (OBS_DIM,) vector.
         reward : float   REWARD_ALIVE normally, REWARD_DEATH on lethal collision.
         done   : bool    True if the player has died.
         """
@@ -471,45 +783,84 @@ class Game:
         if self._agent_policy is not None:
             self._update_agent_inference()
 
-        if action == 1:
-            self.player.jump()
-
-        self.player.update(dt)
-
-        dx = C.GAME_SPEED * dt
+        player = self.player
+        dx = _GAME_SPEED * dt
         self._scroll_x += dx
-        for obs in self.obstacles:
-            obs.update(dx)
-
-        self.obstacles = [o for o in self.obstacles if not o.offscreen]
-
-        if not self._fixed_level:
-            self._maybe_spawn()
-
-        dead = self._check_collision()
-
-        reward = C.REWARD_DEATH if dead else C.REWARD_ALIVE
+        self._obs_version += 1
+
+        if NUMBA_AVAILABLE and player.alive:
+            # JIT fast path: jump, physics, scroll and collision in one call.
+            # Collision runs before cull/spawn here, which is equivalent —
+            # culled rows are left of x=0 and spawned rows right of the screen.
+            (player.y, player.vy, player.last_y, player.on_ground,
+             player.angle, dead, n_cull, self._collision_idx, n_passed) = step_core(
+                self._obs_x, self._obs_w, self._obs_y, self._obs_kind,
+                self._obs_hb_x0, self._obs_hb_x1, self._obs_hb_y0, self._obs_hb_y1,
+                self._obs_cleared,
+                player.x, player.y, player.vy, player.last_y, player.on_ground,
+                player.angle, action == 1, dt, dx, self._collision_idx,
+                _GRAVITY, _JUMP_VEL, _MAX_FALL_SPEED, _GROUND_TOP,
+                _PLAYER_SIZE, _HITBOX_MARGIN, _PLAYER_HB_SIZE,
+            )
+            if dead:
+                player.alive = False
+            self._cull_and_spawn(n_cull)
+        else:
+            if action == 1:
+                player.jump()
+            player.update(dt)
+            self._obs_x -= dx
+            self._cull_and_spawn(self._offscreen_prefix())
+            self._advance_collision_idx()
+            dead = self._check_collision()
+            n_passed = 0 if dead else self._mark_passed()
+
+        reward = _REWARD_DEATH if dead else _REWARD_ALIVE
         
         # Apply sparse rewards for successfully clearing obstacles
-        if not dead:
-            for obs_obj in self.obstacles:
-                if obs_obj not in self._cleared_obstacles and obs_obj.x + obs_obj.w < self.player.x:
-                    self._cleared_obstacles.add(obs_obj)
-                    reward += C.REWARD_CLEAR
+        if n_passed:
+            reward += n_passed * _REWARD_CLEAR
 
         done   = dead
-        obs = self._obs()
-        self._telemetry_obs = obs
+        obs = self._current_obs()
+        if self._obs_mode == "dict":
+            self._telemetry_obs = obs
         self._telemetry_reward = reward
         self._telemetry_done = done
         return obs, reward, done
 
+    def _mark_passed(self) -> int:
+        """Flag obstacles the player has newly passed as cleared; returns how many."""
+        passed = ~self._obs_cleared & (self._obs_x + self._obs_w < self.player.x)
+        n_passed = int(np.count_nonzero(passed))
+        if n_passed:
+            self._obs_cleared |= passed
+        return n_passed
+
+    def _cull_and_spawn(self, n_cull: int) -> None:
+        """Drop the `n_cull` leading off-screen obstacles and spawn new ones ahead."""
+        # Cull obstacles that have fully left the screen (rare — most frames keep all).
+        if n_cull:
+            self._drop_leading_obstacles(n_cull)
+
+        # _next_x is an O(1) cursor on the rightmost spawn slot, so the common
+        # no-spawn frame costs one compare rather than a method call.
+        if not self._fixed_level and self._next_x - self._scroll_x < _SPAWN_HORIZON:
+            self._maybe_spawn()
+
     def render(self) -> None:
         """Draw the current frame to the pygame window."""
         if self.surface is None: return
         self._draw_bg()
         self._draw_ground()
-        for obs in self.obstacles: obs.draw(self.surface, debug=self._debug)
+        # Rows are x-sorted, so everything from the first row starting past
+        # the right edge (plus sprite padding) onwards is off-screen.
+        n_visible = int(np.searchsorted(self._obs_x, C.SCREEN_W + _SPRITE_PAD))
+        visible = islice(self.obstacles, n_visible)
+        if self._debug:
+            for obs in visible: obs.draw(self.surface, debug=True)
+        else:
+            self.surface.blits([obs.blit_args() for obs in visible], doreturn=False)
         self.player.draw(self.surface, debug=self._debug)
         self._draw_hud()
         if self._telemetry_enabled:
@@ -518,13 +869,13 @@ class Game:
 
     def tick(self) -> float:
         """Advance the pygame clock by one frame and return dt in seconds."""
-        if self.clock is None: return 1.0 / C.FPS
+        if self.clock is None: return _FPS_DT
         ms = self.clock.tick(C.FPS)
         return min(ms / 1000.0, 1.0 / 30.0)
 
     def close(self) -> None:
         """Cleanly shut down pygame window resources."""
-        if pygame.get_init(): pygame.quit()
+        if PYGAME_AVAILABLE and pygame.get_init(): pygame.quit()
 
     def toggle_debug(self) -> None:
         """Flip the hitbox debug overlay on/off."""
@@ -564,25 +915,46 @@ class Game:
 
     # ── Observation dict ──────────────────────────────────────────────────────
 
+    def _upcoming_indices(self, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Row indices of obstacles not yet passed by the player, ordered by x.
+        Rows are already x-sorted and everything before the collision cursor
+        is passed, so this is a filter over the tail with no sort.
+
+        With `limit`, only the first `limit` indices are wanted: the filter
+        runs over a short window past the cursor and only falls back to the
+        whole tail when that window doesn't hold enough (fixed levels can
+        have hundreds of rows ahead of the player).
+        """
+        lo, n = self._collision_idx, len(self._obs_x)
+        xs, ws = self._obs_x, self._obs_w
+        if limit is not None:
+            hi = min(n, lo + 2 * limit)
+            idx = lo + np.flatnonzero(xs[lo:hi] + ws[lo:hi] >= _PLAYER_X)
+            if len(idx) >= limit or hi == n:
+                return idx[:limit]
+        return lo + np.flatnonzero(xs[lo:] + ws[lo:] >= _PLAYER_X)[:limit]
+
     def _obs(self) -> dict:
         """
         Build and return the full observation dict.
         Transforms the variable-length obstacle list into a fixed-length 1D array
         so it can be digested by static Neural Network architectures.
         """
-        MAX_OBSTACLES = 5
-        upcoming = sorted([o for o in self.obstacles if o.x + o.w >= C.PLAYER_X], key=lambda o: o.x)
-        
+        MAX_OBSTACLES = _OBS_MAX_OBSTACLES
+        upcoming = self._upcoming_indices(MAX_OBSTACLES)
+
+        # One gather per field, interleaved row-wise as [type, x, y, w, h]
+        # (type numerically: 0.0 for spike, 1.0 for block). Plain-list
+        # interleaving beats stacking into a temporary 2-D array for 5 rows.
         obs_array = []
-        for i in range(MAX_OBSTACLES):
-            if i < len(upcoming):
-                o = upcoming[i]
-                # Represent type numerically: 0.0 for spike, 1.0 for block
-                otype = 0.0 if o.kind == "spike" else 1.0
-                obs_array.extend([otype, float(o.x), float(o._y), float(o.w), float(o.h)])
-            else:
-                # Pad with zeros if there are fewer than MAX_OBSTACLES on screen
-                obs_array.extend([0.0, 0.0, 0.0, 0.0, 0.0])
+        for row in zip(
+            self._obs_kind[upcoming].astype(np.float64).tolist(), self._obs_x[upcoming].tolist(),
+            self._obs_y[upcoming].tolist(), self._obs_w[upcoming].tolist(), self._obs_h[upcoming].tolist(),
+        ):
+            obs_array.extend(row)
+        # Pad with zeros if there are fewer than MAX_OBSTACLES on screen
+        obs_array.extend([0.0] * (5 * (MAX_OBSTACLES - len(upcoming))))
 
         return {
             "player_y":  float(self.player.y),
@@ -591,6 +963,32 @@ class Game:
             "obstacles": obs_array,
         }
 
+    def _obs_array(self) -> np.ndarray:
+        """
+        Fill the preallocated observation vector in place and return it.
+        Same values as _obs() flattened: [player_y, player_vy, on_ground]
+        followed by MAX_OBSTACLES * [type, x, y, w, h], zero-padded.
+        """
+        out = self._obs_arr
+        out[0] = self.player.y
+        out[1] = self.player.vy
+        out[2] = 1.0 if self.player.on_ground else 0.0
+
+        upcoming = self._upcoming_indices(_OBS_MAX_OBSTACLES)
+        k = len(upcoming)
+        lanes = out[3:].reshape(_OBS_MAX_OBSTACLES, _OBS_FEATURES)
+        lanes[:k, 0] = self._obs_kind[upcoming]
+        lanes[:k, 1] = self._obs_x[upcoming]
+        lanes[:k, 2] = self._obs_y[upcoming]
+        lanes[:k, 3] = self._obs_w[upcoming]
+        lanes[:k, 4] = self._obs_h[upcoming]
+        lanes[k:] = 0.0
+        return out
+
+    def _current_obs(self) -> dict | np.ndarray:
+        """Observation in the format selected by obs_mode."""
+        return self._obs_array() if self._obs_mode == "array" else self._obs()
+
     def get_normalized_observation(self) -> list[float]:
         """
         Return observation as a normalized list of floats suitable for NN input.
@@ -598,90 +996,343 @@ class Game:
         Total: 3 + (3 obstacles × 8 features) + 1 = 28 values.
         All normalized to roughly [0, 1] or [-1, 1].
         """
-        obs = self._obs()
+        # Only the player fields of the obs dict are used here, so read them
+        # directly rather than rebuilding the whole dict a second time per step.
+        player = self.player
+        on_ground = 1.0 if player.on_ground else 0.0
         normalized = []
 
+        # Constants and arrays bound once as locals for the loops below
+        ground_y    = C.GROUND_Y
+        player_x    = _PLAYER_X
+        player_y    = player.y
+        player_size = _PLAYER_SIZE
+        block_size  = C.BLOCK_SIZE
+        game_speed  = _GAME_SPEED
+        kinds, xs, ys, ws, hs = self._obs_kind, self._obs_x, self._obs_y, self._obs_w, self._obs_h
+
         # Player state (normalized)
-        normalized.append(obs["player_y"] / C.GROUND_Y)
-        normalized.append(max(-1.0, min(1.0, obs["player_vy"] / C.MAX_FALL_SPEED)))
-        normalized.append(obs["on_ground"])
+        normalized.append(float(player_y) / ground_y)
+        normalized.append(max(-1.0, min(1.0, float(player.vy) / _MAX_FALL_SPEED)))
+        normalized.append(on_ground)
 
         # Obstacle features (reduced to 3 obstacles, 8 features each)
         MAX_OBSTACLES = 3
         VISION_LIMIT_PX = 784.0  # Exactly 7 blocks of vision
 
-        raw_upcoming = sorted([o for o in self.obstacles if o.x + o.w >= C.PLAYER_X], key=lambda o: o.x)
-        # Merge adjacent obstacles of the same type to create macro-obstacles for the MLP
+        # Merge adjacent obstacles of the same type to create macro-obstacles for the MLP.
+        # Once a (MAX_OBSTACLES + 1)-th macro-obstacle starts, the first MAX_OBSTACLES
+        # can no longer grow, so the scan stops there.
+        # Rows are walked from the collision cursor (see _upcoming_indices),
+        # skipping the odd passed row, so only the handful scanned is touched.
         upcoming = []
-        for o in raw_upcoming:
-            if not upcoming:
-                upcoming.append({"kind": o.kind, "x": o.x, "y": o._y, "w": o.w, "h": o.h})
+        for i in range(self._collision_idx, len(xs)):
+            x    = float(xs[i])
+            w    = float(ws[i])
+            if x + w < player_x:
                 continue
-            last = upcoming[-1]
-            if o.kind == last["kind"] and o.x <= last["x"] + last["w"] + 1.0:
-                last["w"] = (o.x + o.w) - last["x"]
-                last["y"] = min(last["y"], o._y)
-                last["h"] = max(last["h"], o.h)
-            else:
-                upcoming.append({"kind": o.kind, "x": o.x, "y": o._y, "w": o.w, "h": o.h})
+            kind = int(kinds[i])
+            y    = float(ys[i])
+            h    = float(hs[i])
+            if upcoming:
+                last = upcoming[-1]
+                if kind == last["kind"] and x <= last["x"] + last["w"] + 1.0:
+                    last["w"] = (x + w) - last["x"]
+                    last["y"] = min(last["y"], y)
+                    last["h"] = max(last["h"], h)
+                    continue
+                if len(upcoming) > MAX_OBSTACLES:
+                    break
+            upcoming.append({"kind": kind, "x": x, "y": y, "w": w, "h": h})
 
         for i in range(MAX_OBSTACLES):
             if i < len(upcoming):
                 o = upcoming[i]
-                rel_x = o["x"] - C.PLAYER_X
+                rel_x = o["x"] - player_x
                 # --- THE DISTANCE MASK ---
                 if rel_x > VISION_LIMIT_PX:
                     # Obstacle is outside the 7-block actionable zone; blind the agent to it
                     normalized.extend([0.0] * 8)
                     continue
                 # -------------------------
-                otype = 0.0 if o["kind"] == "spike" else 1.0
-                rel_y = o["y"] - self.player.y
-                time_to_reach = rel_x / C.GAME_SPEED if C.GAME_SPEED > 0 else 0.0
-                gap_top = max(0.0, o["y"] - (self.player.y + C.PLAYER_SIZE))
-                gap_bot = max(0.0, (self.player.y - C.PLAYER_SIZE) - (o["y"] + o["h"])) if o["kind"] == "block" else 0.0
+                otype = 0.0 if o["kind"] == _KIND_SPIKE else 1.0
+                rel_y = o["y"] - player_y
+                time_to_reach = rel_x / game_speed if game_speed > 0 else 0.0
+                gap_top = max(0.0, o["y"] - (player_y + player_size))
+                gap_bot = max(0.0, (player_y - player_size) - (o["y"] + o["h"])) if o["kind"] == _KIND_BLOCK else 0.0
                 normalized.extend([
                     otype,                                        
                     max(0.0, min(1.0, rel_x / VISION_LIMIT_PX)), # Normalize against vision limit so it scales 0.0 to 1.0
-                    max(-1.0, min(1.0, rel_y / C.GROUND_Y)),     
-                    o["w"] / C.BLOCK_SIZE / 5.0,                 
-                    o["h"] / C.BLOCK_SIZE / 5.0,                 
+                    max(-1.0, min(1.0, rel_y / ground_y)),     
+                    o["w"] / block_size / 5.0,                 
+                    o["h"] / block_size / 5.0,                 
                     max(0.0, min(1.0, time_to_reach / 6.0)),    
-                    max(0.0, min(1.0, gap_top / C.GROUND_Y)),    
-                    max(0.0, min(1.0, gap_bot / C.GROUND_Y)),    
+                    max(0.0, min(1.0, gap_top / ground_y)),    
+                    max(0.0, min(1.0, gap_bot / ground_y)),    
                 ])
             else:
                 # Pad with zeros if fewer than 3 obstacles exist
                 normalized.extend([0.0] * 8)
 
         # is_jump_possible_now (same as on_ground)
-        normalized.append(obs["on_ground"])
+        normalized.append(on_ground)
 
         return normalized
 
+    # ── Obstacle store ────────────────────────────────────────────────────────
+
+    # Per-obstacle arrays, all the same length and in the same row order.
+    #   _obs_x                 : float64  screen x of the left edge (scrolls)
+    #   _obs_y/_obs_w/_obs_h   : float64  top y, width, height
+    #   _obs_kind              : uint8    _KIND_SPIKE / _KIND_BLOCK
+    #   _obs_hb_x0/_obs_hb_x1  : int64    kill-zone left/right edge as offsets from int(x)
+    #   _obs_hb_y0/_obs_hb_y1  : int64    kill-zone top/bottom edge (static)
+    #   (the kill zone matches the objects' hitbox Rect pixel for pixel)
+    #   _obs_cleared           : bool     already rewarded as passed
+    _SOA_FIELDS = (
+        ("_obs_x", np.float64), ("_obs_y", np.float64), ("_obs_w", np.float64),
+        ("_obs_h", np.float64), ("_obs_kind", np.uint8), ("_obs_hb_x0", np.int64),
+        ("_obs_hb_x1", np.int64), ("_obs_hb_y0", np.int64), ("_obs_hb_y1", np.int64),
+        ("_obs_cleared", np.bool_),
+    )
+
+    # Static rows of a default-size spike / block (see _default_rows)
+    _DEFAULT_ROWS: Optional[dict[str, np.ndarray]] = None
+
+    @property
+    def obstacles(self) -> deque[Spike | Block]:
+        """
+        Live obstacle objects (x-sorted), with positions synced from the arrays.
+        Meant for rendering and debugging — the simulation never reads these.
+        Built from the arrays on first access, so pure headless stepping never
+        creates Spike/Block objects at all, and re-synced at most once per
+        step however often it is read. Code that only needs positions should
+        use obstacle_arrays() instead.
+        """
+        if self._obstacle_objs is None:
+            self._obstacle_objs = deque(self._make_obstacle_objs(0, len(self._obs_x)))
+        elif self._objs_version != self._obs_version:
+            xs = self._obs_x
+            for o, x, ix in zip(self._obstacle_objs, xs.tolist(), xs.astype(np.int64).tolist()):
+                o.set_x(x, ix)
+        self._objs_version = self._obs_version
+        return self._obstacle_objs
+
+    def obstacle_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (kind, x, y, w, h) columns of the live obstacles — the same rows, in the
+        same x order, as `obstacles`, without building any objects. kind holds
+        the integer codes (0 = spike, 1 = block). These are views into the
+        obstacle store: treat them as read-only and valid until the next step().
+        """
+        return self._obs_kind, self._obs_x, self._obs_y, self._obs_w, self._obs_h
+
+    def _make_obstacle_objs(self, start: int, stop: int) -> list[Spike | Block]:
+        """Spike/Block objects for array rows [start, stop), recycled from this game's pools."""
+        spikes, blocks = self._spike_pool, self._block_pool
+        rows = zip(
+            self._obs_kind[start:stop].tolist(), self._obs_x[start:stop].tolist(),
+            self._obs_y[start:stop].tolist(), self._obs_w[start:stop].tolist(),
+            self._obs_h[start:stop].tolist(),
+        )
+        return [
+            Spike.acquire(spikes, x, y=y, w=w, h=h) if kind == _KIND_SPIKE
+            else Block.acquire(blocks, x, y=y, h=h)
+            for kind, x, y, w, h in rows
+        ]
+
+    @staticmethod
+    def _obstacle_rows(kind, x, y, w, h) -> dict[str, np.ndarray]:
+        """
+        Array rows (see _SOA_FIELDS) for obstacles given as parallel sequences.
+        The kill-zone columns reproduce Spike/Block hitbox Rects pixel for
+        pixel, computed in bulk so loading a level needs no objects.
+        """
+        kind = np.asarray(kind, dtype=np.uint8)
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        w = np.asarray(w, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        iy = y.astype(np.int64)
+        spike = kind == _KIND_SPIKE
+
+        # Spike kill zone — same arithmetic as Spike.__init__
+        margin    = (w * (1.0 - _SPIKE_HB_WIDTH_FRAC) * 0.5).astype(np.int64)
+        spike_w   = np.maximum(1, (w * _SPIKE_HB_WIDTH_FRAC).astype(np.int64))
+        inset_top = (h * _SPIKE_HB_TOP_INSET_FRAC).astype(np.int64)
+        inset_bot = (h * _SPIKE_HB_BOTTOM_INSET_FRAC).astype(np.int64)
+        spike_h   = np.maximum(1, (h - inset_top - inset_bot).astype(np.int64))
+
+        # Block kill zone is the full rect
+        hb_x0 = np.where(spike, margin, 0)
+        hb_y0 = np.where(spike, iy + inset_top, iy)
+        return {
+            "_obs_x":       x,
+            "_obs_y":       y,
+            "_obs_w":       w,
+            "_obs_h":       h,
+            "_obs_kind":    kind,
+            "_obs_hb_x0":   hb_x0,
+            "_obs_hb_x1":   hb_x0 + np.where(spike, spike_w, w.astype(np.int64)),
+            "_obs_hb_y0":   hb_y0,
+            "_obs_hb_y1":   hb_y0 + np.where(spike, spike_h, h.astype(np.int64)),
+            "_obs_cleared": np.zeros(len(kind), dtype=np.bool_),
+        }
+
+    @classmethod
+    def _build_level_obstacles(cls, obstacle_dicts: list[dict] | np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Convert level dicts (LevelGenerator / YOLO format) into obstacle rows.
+        Returned in ascending x (stable), which the obstacle store relies on.
+        A packed OBSTACLE_DTYPE array is converted column-wise, no per-row loop.
+        """
+        if isinstance(obstacle_dicts, np.ndarray):
+            arr = obstacle_dicts[np.isin(obstacle_dicts["type"], (_KIND_SPIKE, _KIND_BLOCK))]
+            arr = arr[np.argsort(arr["x"], kind="stable")]
+            kind = arr["type"]
+            # Blocks are always BLOCK_W wide, exactly as on the dict path
+            w = np.where(kind == _KIND_BLOCK, float(C.BLOCK_W), arr["w"])
+            return cls._obstacle_rows(kind, arr["x"], arr["y"], w, arr["h"])
+
+        kind, x, y, w, h = [], [], [], [], []
+        for d in sorted(obstacle_dicts, key=lambda d: d["x"]):
+            k = _KIND_BY_NAME.get(d["type"])
+            if k == _KIND_SPIKE:
+                kind.append(k)
+                x.append(d["x"])
+                y.append(d["y"] if d.get("y") is not None else C.GROUND_Y - d["h"])
+                w.append(d["w"])
+                h.append(d["h"])
+            elif k == _KIND_BLOCK:
+                kind.append(k)
+                x.append(d["x"])
+                y.append(d["y"])
+                w.append(C.BLOCK_W)
+                h.append(d["h"])
+        return cls._obstacle_rows(kind, x, y, w, h)
+
+    def _clear_obstacles(self) -> None:
+        """Drop every obstacle (objects and arrays)."""
+        if self._obstacle_objs is not None:
+            for o in self._obstacle_objs:
+                o.release()
+        self._obstacle_objs = None
+        self._collision_idx = 0
+        for name, dtype in self._SOA_FIELDS:
+            setattr(self, name, np.empty(0, dtype=dtype))
+
+    def _set_obstacles(self, rows: dict[str, np.ndarray]) -> None:
+        """Replace the whole obstacle store with `rows` (copied)."""
+        self._clear_obstacles()
+        self._extend_obstacles(rows)
+
+    def _extend_obstacles(self, rows: dict[str, np.ndarray]) -> None:
+        """Append obstacle rows (in x order) to the arrays, and objects if they exist."""
+        n_old = len(self._obs_x)
+        for name, dtype in self._SOA_FIELDS:
+            setattr(self, name, np.concatenate((getattr(self, name), rows[name].astype(dtype, copy=False))))
+        if self._obstacle_objs is not None:
+            self._obstacle_objs.extend(self._make_obstacle_objs(n_old, len(self._obs_x)))
+
+    def _drop_leading_obstacles(self, k: int) -> None:
+        """Drop the first `k` rows (and objects). Slicing keeps the arrays as views."""
+        self._collision_idx = max(0, self._collision_idx - k)
+        if self._obstacle_objs is not None:
+            popleft = self._obstacle_objs.popleft
+            for _ in range(k):
+                popleft().release()
+        for name, _ in self._SOA_FIELDS:
+            setattr(self, name, getattr(self, name)[k:])
+
+    def _offscreen_prefix(self) -> int:
+        """
+        Number of leading rows fully off the left edge.
+        Only the x-sorted prefix is culled: a narrow obstacle that leaves the
+        screen just behind a wider one is dropped a few frames later with it,
+        which is invisible and never reaches collision or observations.
+        """
+        xs, ws = self._obs_x, self._obs_w
+        k, n = 0, len(xs)
+        while k < n and xs[k] + ws[k] < 0:
+            k += 1
+        return k
+
+    def _advance_collision_idx(self) -> None:
+        """
+        Move the collision cursor past obstacles the player has fully passed.
+        Rows only ever scroll left, so the cursor never moves backwards.
+        """
+        i, n = self._collision_idx, len(self._obs_x)
+        xs, ws = self._obs_x, self._obs_w
+        while i < n and xs[i] + ws[i] < _PLAYER_X:
+            i += 1
+        self._collision_idx = i
+
     # ── Spawning ──────────────────────────────────────────────────────────────
 
+    def _seed_rng(self, seed: Optional[int]) -> None:
+        """(Re)seed the NumPy generator behind procedural spawns and drop buffered draws."""
+        self._np_rng   = np.random.default_rng(seed)
+        self._gap_buf  : list[int] = []
+        self._kind_buf : list[int] = []
+        self._gap_idx  = 0
+        self._kind_idx = 0
+
+    def _next_gaps(self, k: int) -> list[int]:
+        """Next k spawn gaps in [GAP_MIN, GAP_MAX], served from batched draws."""
+        i = self._gap_idx
+        if i + k > len(self._gap_buf):
+            fresh = self._np_rng.integers(C.GAP_MIN, C.GAP_MAX + 1, size=max(_RNG_BATCH, k)).tolist()
+            self._gap_buf, i = self._gap_buf[i:] + fresh, 0
+        self._gap_idx = i + k
+        return self._gap_buf[i:i + k]
+
+    def _next_kinds(self, k: int) -> np.ndarray:
+        """Next k spawn kinds, 3:1 spike to block, served from batched draws."""
+        i = self._kind_idx
+        if i + k > len(self._kind_buf):
+            fresh = self._np_rng.integers(0, 4, size=max(_RNG_BATCH, k)).tolist()
+            self._kind_buf, i = self._kind_buf[i:] + fresh, 0
+        self._kind_idx = i + k
+        rolls = np.asarray(self._kind_buf[i:i + k])
+        return np.where(rolls == 3, _KIND_BLOCK, _KIND_SPIKE)
+
     def _spawn_initial(self) -> None:
         """Pre-fill the level with 8 obstacles so the screen isn't empty at start."""
-        x = float(C.SPAWN_X)
-        for _ in range(8):
-            gap = self._rng.randint(C.GAP_MIN, C.GAP_MAX)
-            x  += gap
-            self._add_obstacle(x)
-        self._next_x = x + self._rng.randint(C.GAP_MIN, C.GAP_MAX)
+        gaps = self._next_gaps(9)
+        xs = float(C.SPAWN_X) + np.cumsum(gaps[:8], dtype=np.float64)
+        self._add_obstacles(xs)
+        self._next_x = float(xs[-1]) + gaps[8]
 
     def _maybe_spawn(self) -> None:
         """Spawn new obstacles once existing ones scroll into view range."""
-        while self._next_x - self._scroll_x < C.SCREEN_W + C.GAP_MAX:
-            spawn_screen_x = self._next_x - self._scroll_x + C.PLAYER_X
-            self._add_obstacle(spawn_screen_x)
-            self._next_x += self._rng.randint(C.GAP_MIN, C.GAP_MAX)
-
-    def _add_obstacle(self, x: float) -> None:
-        """Create a random obstacle at screen x-coordinate x."""
-        kind = self._rng.choice(["spike", "spike", "spike", "block"])
-        if kind == "spike": self.obstacles.append(Spike(x))
-        else: self.obstacles.append(Block(x))
+        player_x = _PLAYER_X
+        xs = []
+        while self._next_x - self._scroll_x < _SPAWN_HORIZON:
+            xs.append(self._next_x - self._scroll_x + player_x)
+            self._next_x += self._next_gaps(1)[0]
+        self._add_obstacles(xs)
+
+    def _add_obstacles(self, xs) -> None:
+        """
+        Append random default-size obstacles at screen x-coordinates `xs` in one batch.
+        Every column except x is static per kind, so rows are gathered from
+        the precomputed default spike/block rows rather than recomputed.
+        """
+        kinds = self._next_kinds(len(xs))
+        rows = {name: col[kinds] for name, col in self._default_rows().items()}
+        rows["_obs_x"] = np.asarray(xs, dtype=np.float64)
+        self._extend_obstacles(rows)
+
+    @classmethod
+    def _default_rows(cls) -> dict[str, np.ndarray]:
+        """Rows for a default spike (row _KIND_SPIKE) and block (row _KIND_BLOCK), built once."""
+        if cls._DEFAULT_ROWS is None:
+            cls._DEFAULT_ROWS = cls._obstacle_rows(
+                [_KIND_SPIKE, _KIND_BLOCK], [0.0, 0.0],
+                [C.SPIKE_TOP_Y, C.BLOCK_TOP_Y], [C.SPIKE_W, C.BLOCK_W], [C.SPIKE_H, C.BLOCK_H],
+            )
+        return cls._DEFAULT_ROWS
 
     # ── Collision ─────────────────────────────────────────────────────────────
 
@@ -689,96 +1340,143 @@ class Game:
         """
         Calculates collision and resolves platforming physics.
         Differentiates between a fatal wall crash and a safe landing on top of a block.
+
+        Only obstacles horizontally under the cube can kill or support it, so
+        the collision cursor and a sorted-x bound narrow the store to those
+        few rows (at most two or three) and they are resolved in row
+        order exactly like a per-obstacle loop: after a landing snaps the
+        player onto a block, the remaining rows are re-tested against the
+        updated player hitbox.
         
         Returns True if a lethal collision occurred.
         """
-        pr = self.player.hitbox
-        
+        player = self.player
+
         # Calculate the lowest point the player was at in the previous frame.
         # This is vital for Continuous Collision Detection (CCD) to ensure the 
         # player doesn't clip through thin platforms when moving fast.
-        prev_bottom = self.player.last_y + C.PLAYER_SIZE
+        prev_bottom = player.last_y + _PLAYER_SIZE
 
         # Tracks if the player is currently resting on a block this frame
         currently_supported = False
 
-        for obs in self.obstacles:
-            # 1. Check for overlapping hitboxes
-            if pr.colliderect(obs.hitbox):
-                
-                if obs.kind == "spike":
-                    self.player.alive = False
+        # Rows are sorted by x: rows before the cursor are behind the player and
+        # rows past the searchsorted bound are still ahead of it.
+        xs = self._obs_x
+        lo = self._collision_idx
+        hi = lo + int(np.searchsorted(xs[lo:], player.x + _PLAYER_SIZE, side="right"))
+        near = lo + np.flatnonzero(xs[lo:hi] + self._obs_w[lo:hi] >= player.x)
+
+        py0 = int(player.y) + _HITBOX_MARGIN
+        py1 = py0 + _PLAYER_HB_SIZE
+        for x, w, y, kind, hx0, hx1, hy0, hy1 in zip(
+            xs[near].tolist(), self._obs_w[near].tolist(), self._obs_y[near].tolist(),
+            self._obs_kind[near].tolist(),
+            self._obs_hb_x0[near].tolist(), self._obs_hb_x1[near].tolist(),
+            self._obs_hb_y0[near].tolist(), self._obs_hb_y1[near].tolist(),
+        ):
+            ix = int(x)
+
+            # 1. Overlapping hitboxes
+            if ix + hx0 < _PLAYER_HB_X1 and ix + hx1 > _PLAYER_HB_X0 and hy0 < py1 and hy1 > py0:
+                if kind == _KIND_SPIKE:
+                    player.alive = False
+                    return True
+
+                # LANDING LOGIC:
+                # If the player is falling (vy >= 0) AND their previous bottom edge 
+                # was higher than the top of the block (plus an 8px physics forgiveness margin), 
+                # they safely land.
+                if player.vy >= 0 and prev_bottom <= y + 8:
+                    player.y = y - _PLAYER_SIZE
+                    player.vy = 0.0
+                    player.on_ground = True
+                    player.angle = 0.0
+                    currently_supported = True
+                    py0 = int(player.y) + _HITBOX_MARGIN
+                    py1 = py0 + _PLAYER_HB_SIZE
+                else:
+                    # Player hit the side or bottom of the block — Lethal
+                    player.alive = False
                     return True
-                
-                elif obs.kind == "block":
-                    # LANDING LOGIC:
-                    # If the player is falling (vy >= 0) AND their previous bottom edge 
-                    # was higher than the top of the block (plus an 8px physics forgiveness margin), 
-                    # they safely land.
-                    if self.player.vy >= 0 and prev_bottom <= obs._y + 8:
-                        self.player.y = obs._y - C.PLAYER_SIZE
-                        self.player.vy = 0.0
-                        self.player.on_ground = True
-                        self.player.angle = 0.0
-                        currently_supported = True
-                        
-                        # Re-calculate the player's bounding box since we snapped them to the platform
-                        pr = self.player.hitbox 
-                    else:
-                        # Player hit the side or bottom of the block — Lethal
-                        self.player.alive = False
-                        return True
 
             # 2. Check for ground support even if not strictly colliding
             # This prevents gravity from erroneously pulling the player down 
             # while they are sliding perfectly flush across the top of a platform.
-            elif obs.kind == "block":
-                if (obs.x <= self.player.x + C.PLAYER_SIZE and 
-                    obs.x + obs.w >= self.player.x and
-                    abs(self.player.y + C.PLAYER_SIZE - obs._y) < 2):
-                    currently_supported = True
+            elif (not currently_supported and kind == _KIND_BLOCK
+                    and abs(player.y + _PLAYER_SIZE - y) < 2):
+                currently_supported = True
 
         # 3. Handle walking off ledges
         # If the player is not on the main floor and not supported by a block, they fall.
-        if not currently_supported and self.player.y < C.GROUND_Y - C.PLAYER_SIZE:
-            self.player.on_ground = False
+        if not currently_supported and player.y < _GROUND_TOP:
+            player.on_ground = False
 
         return False
 
     # ── Drawing helpers ───────────────────────────────────────────────────────
 
+    def _build_static_layers(self) -> None:
+        """
+        Pre-render the background and ground panel once.
+        Only the ground's tile offset changes between frames, so the panel is
+        drawn one tile wider than the screen and blitted at the scroll offset.
+        """
+        bg = pygame.Surface((C.SCREEN_W, C.GROUND_Y))
+        bg.fill(C.BG_COLOR)
+        for y in range(0, C.GROUND_Y, 60):
+            pygame.draw.line(bg, C.GRID_COLOR, (0, y), (C.SCREEN_W, y), 1)
+
+        tile   = C.BLOCK_SIZE
+        width  = C.SCREEN_W + tile
+        height = C.SCREEN_H - C.GROUND_Y
+        ground = pygame.Surface((width, height))
+        ground.fill(C.GROUND_COLOR)
+        pygame.draw.line(ground, (75, 75, 100), (0, 0), (width, 0), 2)
+        for gx in range(0, width, tile):
+            pygame.draw.line(ground, (60, 60, 85), (gx, 0), (gx, height), 1)
+
+        self._bg_cached = bg.convert()
+        self._ground_panel = ground.convert()
+
     def _draw_bg(self) -> None:
         """Dark background with subtle horizontal grid lines."""
-        self.surface.fill(C.BG_COLOR)
-        for y in range(0, C.GROUND_Y, 60):
-            pygame.draw.line(self.surface, C.GRID_COLOR, (0, y), (C.SCREEN_W, y), 1)
+        self.surface.blit(self._bg_cached, (0, 0))
 
     def _draw_ground(self) -> None:
         """Ground panel with scrolling vertical tile lines."""
-        pygame.draw.rect(self.surface, C.GROUND_COLOR, (0, C.GROUND_Y, C.SCREEN_W, C.SCREEN_H - C.GROUND_Y))
-        pygame.draw.line(self.surface, (75, 75, 100), (0, C.GROUND_Y), (C.SCREEN_W, C.GROUND_Y), 2)
-        tile   = C.BLOCK_SIZE                  
-        offset = int(self._scroll_x) % tile    
-        for gx in range(-tile + offset, C.SCREEN_W, tile):
-            pygame.draw.line(self.surface, (60, 60, 85), (gx, C.GROUND_Y), (gx, C.SCREEN_H), 1)
+        tile   = C.BLOCK_SIZE
+        offset = int(self._scroll_x) % tile
+        self.surface.blit(self._ground_panel, (offset - tile, C.GROUND_Y))
 
     def _draw_hud(self) -> None:
         """Top-left HUD showing distance and debug state."""
         if self.font is None: return
-        lines = [
+        # Counter lines change every frame and are rendered fresh; the toggle
+        # and agent lines only change on a key press, so they are rendered
+        # once and reused from the cache.
+        counters = [
             f"dist : {int(self._scroll_x):>7} px",
             f"steps: {self._step_n:>7}",
+        ]
+        labels = [
             f"debug: {'ON ' if self._debug else 'OFF'}  (H to toggle)",
             f"telem: {'ON ' if self._telemetry_enabled else 'OFF'}  (T to toggle)",
         ]
         
         # Add AI agent indicator if in agent mode
         if self._agent_enabled:
-            lines.append(f"agent: AI MODE  (watching trained agent)")
+            labels.append(f"agent: AI MODE  (watching trained agent)")
         
-        for i, line in enumerate(lines):
-            surf = self.font.render(line, True, C.HUD_COLOR)
-            self.surface.blit(surf, (10, 10 + i * 20))
+        font, surface, color = self.font, self.surface, C.HUD_COLOR
+        for i, line in enumerate(counters):
+            surface.blit(font.render(line, True, color), (10, 10 + i * 20))
+        cache = self._hud_text
+        for i, line in enumerate(labels, start=len(counters)):
+            surf = cache.get(line)
+            if surf is None:
+                surf = cache[line] = font.render(line, True, color)
+            surface.blit(surf, (10, 10 + i * 20))
 
     def _draw_telemetry_panel(self) -> None:
         """Right-side in-game telemetry panel."""
@@ -798,7 +1496,7 @@ class Game:
         obs = self._telemetry_obs if self._telemetry_obs else self._obs()
         obstacles = obs.get("obstacles", [])
         if len(obstacles) >= 5 and (obstacles[1] != 0.0 or obstacles[3] != 0.0):
-            otype = "spike" if obstacles[0] == 0.0 else "block"
+            otype = _KIND_NAMES[int(obstacles[0])]
             next_obs = f"{otype} x={obstacles[1]:.1f} y={obstacles[2]:.1f} w={obstacles[3]:.1f} h={obstacles[4]:.1f}"
         else:
             next_obs = "none"
@@ -833,6 +1531,89 @@ class Game:
             self.surface.blit(surf, (panel_x + 10, panel_y + 10 + i * 28))
 
 
+# =============================================================================
+# Batched environments
+# =============================================================================
+
+class VecGame:
+    """
+    n_envs independent headless worlds stepped together.
+
+    Each world is a Game(render=False, obs_mode="array") whose obs_out is a
+    row of one shared (n_envs, OBS_DIM) float32 buffer, so stepping the batch
+    fills the observation matrix in place with no stacking or copying.
+    Worlds that die are reset immediately, as in an SB3 VecEnv: the obs row
+    of a done env is already the first observation of its next episode, and
+    its info dict carries the last observation of the finished one under
+    "terminal_observation".
+
+    The returned obs / rewards / dones arrays are reused between calls — copy
+    them if you need to keep them.
+
+    Parameters
+    ----------
+    n_envs : int
+        Number of parallel worlds.
+    seed : int | None
+        Base seed; env i is seeded with seed + i (None = unseeded worlds).
+    """
+
+    def __init__(self, n_envs: int, seed: Optional[int] = None) -> None:
+        if n_envs < 1:
+            raise ValueError(f"n_envs must be >= 1, got {n_envs}")
+        self.n_envs   = n_envs
+        self._obs     = np.zeros((n_envs, Game.OBS_DIM), dtype=np.float32)
+        self._rewards = np.zeros(n_envs, dtype=np.float32)
+        self._dones   = np.zeros(n_envs, dtype=bool)
+
+        # World i writes its observation straight into row i
+        self.games: list[Game] = [
+            Game(render=False, seed=None if seed is None else seed + i,
+                 obs_mode="array", obs_out=self._obs[i])
+            for i in range(n_envs)
+        ]
+
+    def reset(self) -> np.ndarray:
+        """Reset every world and return the (n_envs, obs_dim) observation batch."""
+        for game in self.games:
+            game.reset()
+        return self._obs
+
+    def step(self, actions) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        """
+        Step every world once.
+
+        Parameters
+        ----------
+        actions : sequence of int, length n_envs
+            Per-world action (0 = do nothing, 1 = jump).
+
+        Returns
+        -------
+        obs     : np.ndarray  (n_envs, obs_dim) float32
+        rewards : np.ndarray  (n_envs,) float32
+        dones   : np.ndarray  (n_envs,) bool — done worlds have already been reset
+        infos   : list[dict]  one per world; a done world's holds
+                  "terminal_observation", a copy of its final obs row
+        """
+        rewards = self._rewards
+        dones   = self._dones
+        infos: list[dict] = [{} for _ in range(self.n_envs)]
+        for i, (game, action) in enumerate(zip(self.games, np.asarray(actions).tolist())):
+            obs, reward, done = game.step(action)
+            rewards[i] = reward
+            dones[i]   = done
+            if done:
+                infos[i]["terminal_observation"] = obs.copy()
+                game.reset()
+        return self._obs, rewards, dones, infos
+
+    def close(self) -> None:
+        """Release every world (no display is ever opened, so this is cheap)."""
+        for game in self.games:
+            game.close()
+
+
 # =============================================================================
 # Human play entry point
 # =============================================================================
@@ -993,13 +1774,15 @@ def main() -> None:
         else:
             action = 0
 
+        # A jump key going down is latched for this frame, so a tap released
+        # before the held-key check below still jumps.
+        tapped = False
         for event in pygame.event.get():
             if event.type == pygame.QUIT: running = False
             elif event.type == pygame.KEYDOWN:
-                # Only allow manual jumps in human mode
-                if not args.agent and event.key in (pygame.K_SPACE, pygame.K_UP): 
-                    action = 1
-                if event.key == pygame.K_r:
+                if event.key in (pygame.K_SPACE, pygame.K_UP):
+                    tapped = True
+                elif event.key == pygame.K_r:
                     # Reload the same level (if using LevelGenerator)
                     if level_obstacles is not None:
                         game.load_level(level_obstacles)
@@ -1010,10 +1793,10 @@ def main() -> None:
                 elif event.key == pygame.K_t: game.toggle_telemetry()
                 elif event.key in (pygame.K_q, pygame.K_ESCAPE): running = False
 
-        # Check held keys for responsive jumping (human mode only)
+        # Tapped or held keys drive jumping (human mode only)
         if not args.agent:
             keys = pygame.key.get_pressed()
-            if keys[pygame.K_SPACE] or keys[pygame.K_UP]: action = 1
+            if tapped or keys[pygame.K_SPACE] or keys[pygame.K_UP]: action = 1
 
         obs, reward, done = game.step(action, dt)
         game.render()
@@ -108,37 +108,28 @@ class GeometryDashGymEnv(gym.Env):
         print(f"[DEBUG][stairs] Checking: player_x={player_x}, player_y={player_y}, player_w={player_w}, player_bottom={player_bottom}")
 
         # Find all blocks that horizontally overlap with the player
-        blocks_under = [
-            obs for obs in self._game.obstacles
-            if getattr(obs, 'kind', None) == 'block'
-            and (player_x + player_w > obs.x)
-            and (player_x < obs.x + obs.w)
-        ]
-        if not blocks_under:
+        # (column-wise over the obstacle arrays; no Spike/Block objects needed)
+        kind, xs, ys, ws, _ = self._game.obstacle_arrays()
+        under = (kind == 1) & (player_x + player_w > xs) & (player_x < xs + ws)   # 1 = block
+        if not under.any():
             print(f"[DEBUG][stairs] No blocks under player.")
             return False
 
         # Find the block directly under the player's feet (closest to player_bottom, but not above it)
-        blocks_below = [b for b in blocks_under if b._y >= player_bottom - 8]
-        if not blocks_below:
+        below_ys = ys[under & (ys >= player_bottom - 8)]
+        if not len(below_ys):
             print(f"[DEBUG][stairs] No blocks directly under player's feet.")
             return False
-        top_block = min(blocks_below, key=lambda b: b._y)
-        y_diff = abs(player_bottom - top_block._y)
-        print(f"[DEBUG][stairs] Top block y={top_block._y}, y_diff={y_diff}")
+        top_block_y = float(below_ys.min())
+        y_diff = abs(player_bottom - top_block_y)
+        print(f"[DEBUG][stairs] Top block y={top_block_y}, y_diff={y_diff}")
         if y_diff > 8:
             print(f"[DEBUG][stairs] Player not close enough to top block (y_diff={y_diff}).")
             return False
 
         # Check if there is any block above this one (same x overlap, smaller y)
-        blocks_above = [
-            obs for obs in self._game.obstacles
-            if getattr(obs, 'kind', None) == 'block'
-            and (player_x + player_w > obs.x)
-            and (player_x < obs.x + obs.w)
-            and obs._y < top_block._y - 2
-        ]
-        if blocks_above:
+        blocks_above = np.flatnonzero(under & (ys < top_block_y - 2))
+        if len(blocks_above):
             print(f"[DEBUG][stairs] There are further stairs above (blocks_above count: {len(blocks_above)}).")
             return False
         print(f"[DEBUG][stairs] Player is on top of stairs with no further up.")
@@ -225,7 +216,9 @@ class GeometryDashGymEnv(gym.Env):
     def _ensure_game_initialized(self) -> None:
         """Create Game instance lazily so reset() can be called repeatedly."""
         if self._game is None:
-            self._game = Game(render=self.config.render)
+            # Step observations are discarded here (see _current_observation),
+            # so skip building the per-step obs dict.
+            self._game = Game(render=self.config.render, obs_mode="array")
 
     def _current_observation(self) -> np.ndarray:
         """Get normalized observation as np.float32 vector."""
@@ -239,17 +232,12 @@ class GeometryDashGymEnv(gym.Env):
         player_front_x = float(self._game.player.x + self._game.player.hitbox.width)
         nearest_distance: Optional[float] = None
 
-        for obstacle in self._game.obstacles:
-            obstacle_front_x = float(obstacle.x)
-
-            # Ignore obstacles if the player's front edge has already passed 
-            # the obstacle's front edge (e.g., player is currently on top of a wide block)
-            if obstacle_front_x <= player_front_x:
-                continue
-
-            distance = obstacle_front_x - player_front_x
-            if nearest_distance is None or distance < nearest_distance:
-                nearest_distance = distance
+        # Ignore obstacles if the player's front edge has already passed
+        # the obstacle's front edge (e.g., player is currently on top of a wide block)
+        _, xs, _, _, _ = self._game.obstacle_arrays()
+        ahead = xs[xs > player_front_x]
+        if len(ahead):
+            nearest_distance = float(ahead.min()) - player_front_x
 
         return nearest_distance
 
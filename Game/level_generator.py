@@ -233,6 +233,9 @@ ADDING NEW CHUNK PATTERNS
     - Never place spikes < 3 blocks apart (player can't fit between them)
     - Stacked blocks > 3 high are unjumpable — don't use them
     - Always return the correct width so the gap between chunks is right
+    - Return obstacles in ascending x order (ties in stacking order) and keep
+      them inside [x, x + width) — generate() concatenates chunks as-is,
+      without a final sort
 =============================================================================
 """
 
@@ -240,26 +243,44 @@ ADDING NEW CHUNK PATTERNS
 from __future__ import annotations
 
 import random
-from typing import Optional
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterator, Optional
+
+import numpy as np
 
 import constants as C
 
 B = C.BLOCK_SIZE   # 30px shorthand — everything is multiples of this
 
+# rng_kind="pcg64" pre-draws uniforms from NumPy in batches of this size.
+_RNG_BATCH = 64
+
+# Where the first chunk starts: 1.5s of run-up past the right screen edge.
+_START_X = float(C.SCREEN_W + C.GAME_SPEED * 1.5)
+
 
 # =============================================================================
 # Low-level object helpers
 # =============================================================================
 
+# Obstacle geometry as the floats the dicts carry, converted once at import
+_SPIKE_Y = float(C.SPIKE_TOP_Y)
+_SPIKE_W = float(C.SPIKE_W)
+_SPIKE_H = float(C.SPIKE_H)
+_BLOCK_W = float(C.BLOCK_W)
+_BLOCK_H = float(C.BLOCK_H)
+
+
+def _xpos(x):
+    """float(x) for an obstacle's x — a template trace (_XTrace) passes through."""
+    return x if isinstance(x, _XTrace) else float(x)
+
 def _spike(x: float) -> dict:
     """One spike sitting on the ground."""
-    return {
-        "type": "spike",
-        "x":    float(x),
-        "y":    float(C.GROUND_Y - C.SPIKE_H),
-        "w":    float(C.SPIKE_W),
-        "h":    float(C.SPIKE_H),
-    }
+    return {"type": "spike", "x": _xpos(x), "y": _SPIKE_Y, "w": _SPIKE_W, "h": _SPIKE_H}
 
 def _block(x: float, stack: int = 1) -> list[dict]:
     """
@@ -271,18 +292,55 @@ def _block(x: float, stack: int = 1) -> list[dict]:
     Returns a list of dicts (one per block in the column).
     Each block is a separate object with its own y position.
     """
+    x = _xpos(x)
     return [
         {
             "type": "block",
-            "x":    float(x),
+            "x":    x,
             "y":    float(C.GROUND_Y - C.BLOCK_H * (i + 1)),
-            "w":    float(C.BLOCK_W),
-            "h":    float(C.BLOCK_H),
+            "w":    _BLOCK_W,
+            "h":    _BLOCK_H,
         }
         for i in range(stack)
     ]
 
 
+# =============================================================================
+# Packed array form
+# =============================================================================
+# The same obstacles as one contiguous NumPy record array, for consumers that
+# want columns rather than dicts (Game.load_level accepts either form and
+# builds its obstacle store from the columns without a per-dict loop).
+# Coordinates stay float64 so packed levels are bit-identical to the dicts.
+
+TYPE_SPIKE = 0   # same codes as the observation "type" feature
+TYPE_BLOCK = 1
+
+OBSTACLE_DTYPE = np.dtype([
+    ("type", np.uint8),
+    ("x",    np.float64),
+    ("y",    np.float64),
+    ("w",    np.float64),
+    ("h",    np.float64),
+])
+
+_TYPE_CODES = {"spike": TYPE_SPIKE, "block": TYPE_BLOCK}
+
+
+def obstacles_to_array(obstacles: list[dict]) -> np.ndarray:
+    """
+    Pack obstacle dicts (order preserved) into an OBSTACLE_DTYPE array.
+    Dicts whose "type" is neither "spike" nor "block" are skipped, the same
+    as Game.load_level does for both dicts and packed arrays.
+    """
+    obstacles = [o for o in obstacles if o["type"] in _TYPE_CODES]
+    arr = np.empty(len(obstacles), dtype=OBSTACLE_DTYPE)
+    arr["type"] = [_TYPE_CODES[o["type"]] for o in obstacles]
+    for field in ("x", "y", "w", "h"):
+        arr[field] = [o[field] for o in obstacles]
+    return arr
+
+
 # =============================================================================
 # Chunk functions
 # =============================================================================
@@ -365,14 +423,15 @@ def chunk_spike_on_block(x: float) -> tuple[list[dict], float]:
     objs = []
     for col in range(3):
         objs.extend(_block(x + col * B, stack=1))
-    # Spike sits on top of middle block
-    objs.append({
-        "type": "spike",
-        "x":    float(x + B),          # centred on the 3-wide platform
-        "y":    float(C.GROUND_Y - C.BLOCK_H - C.SPIKE_H),
-        "w":    float(C.SPIKE_W),
-        "h":    float(C.SPIKE_H),
-    })
+        if col == 1:
+            # Spike sits on top of middle block (listed after it, in x order)
+            objs.append({
+                "type": "spike",
+                "x":    _xpos(x + B),          # centred on the 3-wide platform
+                "y":    float(C.BLOCK_TOP_Y - C.SPIKE_H),
+                "w":    float(C.SPIKE_W),
+                "h":    float(C.SPIKE_H),
+            })
     return objs, float(3 * B)
 
 def chunk_platform_with_spike_ends(x: float) -> tuple[list[dict], float]:
@@ -585,6 +644,161 @@ POOL_5 = [   # Phase 5: High density with broad pattern coverage
 
 POOLS = {1: POOL_1, 2: POOL_2, 3: POOL_3, 4: POOL_4, 5: POOL_5, 6: POOL_5}  # Cap at Phase 5
 
+SPIKE_ONLY_POOL = [   # generate_spike_only(): every spike motif, equal weight
+    (chunk_single_spike,            1),
+    (chunk_double_spike,            1),
+    (chunk_triple_spike,            1),
+    (chunk_spike_gate,              1),
+    (chunk_alternating_spikes,      1),
+    (chunk_spike_cluster,           1),
+    (chunk_triple_then_single,      1),
+]
+
+
+def _build_alias(weights: list[float]) -> tuple[list[float], list[int]]:
+    """
+    Walker/Vose alias table for O(1) weighted sampling.
+    Entry i is kept with probability prob[i], otherwise alias[i] is used.
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob, alias = [1.0] * n, list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s], alias[s] = scaled[s], l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    return prob, alias
+
+
+@lru_cache(maxsize=64)
+def _pool_table(pool: tuple[tuple, ...]) -> tuple:
+    """
+    Sampling table for one pool: (fns, cumulative weights, alias prob, alias).
+    The cumulative weights serve the legacy random.Random path (same draws as
+    ever); the alias table serves rng_kind="pcg64".
+
+    Cached by pool *contents* (callers pass tuple(pool)), so editing a POOLS
+    list in place takes effect on the next lookup, and ad-hoc pools are only
+    tabled once.
+    """
+    fns, weights = zip(*pool)
+    return (fns, list(accumulate(weights))) + _build_alias(list(weights))
+
+
+# ── Chunk templates ──
+# Every built-in chunk is translation-invariant: chunk_fn(x) is chunk_fn(0)
+# shifted right by x. Each one is traced once with an _XTrace for x, which
+# records, per obstacle, the offsets the chunk adds to x and in what order
+# (e.g. (B, col*B) for a block at (x + B) + col*B). Placement replays those
+# additions on the real x, so the result is the same float arithmetic as
+# chunk_fn(x) — bit-identical for any x, including the fractional ones the
+# generators produce. Chunks outside this tuple (e.g. user-added ones) are
+# always called directly; a new chunk opts in by being listed here.
+_TEMPLATE_CHUNKS = (
+    chunk_single_spike, chunk_double_spike, chunk_triple_spike,
+    chunk_single_block_wall, chunk_double_block_wall, chunk_block_platform,
+    chunk_spike_on_block, chunk_platform_with_spike_ends,
+    chunk_staircase_up, chunk_staircase_down, chunk_staircase_up_wide,
+    chunk_staircase_up_with_spike, chunk_staircase_double,
+    chunk_alternating_spikes, chunk_spike_gate, chunk_spike_then_platform,
+    chunk_spike_cluster, chunk_flat_ground, chunk_triple_then_single,
+)
+_X_TERMS = 3               # longest offset chain among the built-in chunks
+_CHUNK_TEMPLATES: dict = {}
+_CHUNK_ARRAYS: dict = {}   # the same templates as (type codes, offset terms, [y, w, h] rows) arrays
+
+
+class _XTrace:
+    """Stand-in for a chunk's x that records the offsets added to it."""
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: tuple = ()):
+        self.terms = terms
+
+    def __add__(self, other):
+        if isinstance(other, (int, float)):
+            return _XTrace(self.terms + (other,))
+        return NotImplemented
+
+
+def _chunk_template(chunk_fn) -> Optional[tuple[list[tuple[dict, tuple]], float]]:
+    """
+    chunk_fn traced at x: ([(obstacle dict, x offset terms), ...], width),
+    or None when placing it must call chunk_fn.
+    """
+    if chunk_fn not in _TEMPLATE_CHUNKS:
+        return None
+    template = _CHUNK_TEMPLATES.get(chunk_fn)
+    if template is None:
+        objs, width = chunk_fn(_XTrace())
+        template = _CHUNK_TEMPLATES[chunk_fn] = (
+            [(o, o["x"].terms) for o in objs], width)
+    return template
+
+
+def _place_chunk(chunk_fn, x: float) -> tuple[list[dict], float]:
+    """chunk_fn(x), served from its traced template (bit-identical)."""
+    template = _chunk_template(chunk_fn)
+    if template is None:
+        return chunk_fn(x)
+    objs, width = template
+    placed = []
+    for o, terms in objs:
+        ox = x
+        for t in terms:
+            ox += t
+        placed.append({**o, "x": ox})
+    return placed, width
+
+
+def _chunk_columns(objs: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Obstacle dicts as (uint8 type codes, float64 x, float64 [y, w, h] rows)."""
+    arr = obstacles_to_array(objs)
+    return arr["type"].copy(), arr["x"].copy(), np.column_stack((arr["y"], arr["w"], arr["h"]))
+
+
+def _pack_template(template) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """A traced template as (type codes, (n, _X_TERMS) offset terms, [y, w, h] rows)."""
+    objs, _ = template
+    if any(len(terms) > _X_TERMS for _, terms in objs):
+        return None
+    # Zero-padding the chains is exact: (x + a) + 0.0 == x + a.
+    terms = np.zeros((len(objs), _X_TERMS))
+    for i, (_, chain) in enumerate(objs):
+        terms[i, :len(chain)] = chain
+    types, _, rows = _chunk_columns([{**o, "x": 0.0} for o, _ in objs])
+    return types, terms, rows
+
+
+def _place_chunk_array(chunk_fn, x: float) -> tuple[tuple[np.ndarray, np.ndarray, np.ndarray, float], float]:
+    """
+    Packed counterpart of _place_chunk: ((types, terms, rows, x), width),
+    where each obstacle's x is x plus its offset terms, added left to right,
+    and rows are its [y, w, h]. Template arrays are shared, never copied
+    here — generate_array() makes the additions in one vectorized pass per
+    term column, the same float64 additions _place_chunk makes per dict.
+    """
+    template = _chunk_template(chunk_fn)
+    packed = None
+    if template is not None:
+        packed = _CHUNK_ARRAYS.get(chunk_fn)
+        if packed is None and chunk_fn not in _CHUNK_ARRAYS:
+            packed = _CHUNK_ARRAYS[chunk_fn] = _pack_template(template)
+    if packed is None:
+        # Absolute x as the lone term on a 0.0 offset: 0.0 + x == x.
+        objs, width = chunk_fn(x)
+        types, xs, rows = _chunk_columns(objs)
+        terms = np.zeros((len(xs), _X_TERMS))
+        terms[:, 0] = xs
+        return (types, terms, rows, 0.0), width
+    return (*packed, x), template[1]
+
+
 # Gap BETWEEN chunks at each difficulty (Calculated dynamically via actual Game Speed)
 GAPS = {
     1: (int(0.35 * C.GAME_SPEED), int(0.60 * C.GAME_SPEED)), # 0.35s to 0.60s (many single spikes with clear spacing)
@@ -613,6 +827,13 @@ class LevelGenerator:
     progressive : bool
         Ramp difficulty from 1 → `difficulty` over the first 70% of the level.
         Good for curriculum RL training.
+    rng_kind : str
+        "legacy" (default) draws from random.Random exactly as the original
+        generator did, so a seed reproduces the levels it always has
+        (test_level_generator checks them against that loop). "pcg64" draws uniforms from a NumPy PCG64
+        Generator in batches and maps them onto chunk picks and gaps (in
+        generate() and every generate_*_only mode) — faster for high-volume
+        generation, but a different level per seed.
     """
 
     def __init__(
@@ -620,11 +841,18 @@ class LevelGenerator:
         difficulty  : int           = 1,
         seed        : Optional[int] = None,
         progressive : bool          = False,
+        rng_kind    : str           = "legacy",
     ) -> None:
         assert 1 <= difficulty <= 6, "difficulty must be 1–6"
+        if rng_kind not in ("legacy", "pcg64"):
+            raise ValueError(f"rng_kind must be 'legacy' or 'pcg64', got {rng_kind!r}")
         self.difficulty  = difficulty
         self.progressive = progressive
+        self.rng_kind    = rng_kind
         self._rng        = random.Random(seed)
+        self._np_rng     = np.random.default_rng(seed) if rng_kind == "pcg64" else None
+        self._u_buf      : list[float] = []
+        self._u_idx      = 0
 
     def generate(self, length: int = 6000) -> list[dict]:
         """
@@ -639,21 +867,50 @@ class LevelGenerator:
         -------
         list[dict] — obstacle dicts sorted by x, ready for Game.load_level()
         """
-        obstacles: list[dict] = []
+        return list(self.iter_obstacles(length))
+
+    def iter_obstacles(self, length: int = 6000) -> Iterator[dict]:
+        """
+        Lazy form of generate(): yields the same obstacle dicts in x order
+        (chunks emit in x order and never overlap), one chunk at a time,
+        drawing from the RNG only as it is consumed.
+        """
+        for chunk_objs in self._iter_chunks(length, _place_chunk):
+            yield from chunk_objs
+
+    def _iter_chunks(self, length: int, place) -> Iterator:
+        """
+        The chunk-by-chunk level loop shared by generate() and
+        generate_array(): picks chunks and gaps, and yields whatever
+        `place(chunk_fn, x)` returns as its first element for each chunk
+        (dicts from _place_chunk, packed rows from _place_chunk_array).
+        """
         chunks_since_double_spike = 0
 
         # Start well past the right edge so first obstacle scrolls in naturally.
         # 1.5s of run-up at 300px/s = 450px buffer.
-        x = float(C.SCREEN_W + C.GAME_SPEED * 1.5)
-
-        while x < length + C.SCREEN_W:
+        x = _START_X
+
+        # Pool sampling table and gap range for the current difficulty. Fixed
+        # for the whole level unless progressive, where they are re-fetched
+        # only when the ramp actually moves to a new difficulty. Tables are
+        # looked up by pool contents, so edits to POOLS apply from there on.
+        progressive = self.progressive
+        end_x       = length + C.SCREEN_W
+        cur_diff    = self.difficulty
+        table       = _pool_table(tuple(POOLS[cur_diff]))
+        gap_min, gap_max = GAPS[cur_diff]
+
+        while x < end_x:
             # Determine current difficulty
-            if self.progressive:
+            if progressive:
                 progress = min((x - C.SCREEN_W) / length, 1.0)
                 ramp     = min(progress / 0.7, 1.0)      # ramp over first 70%
-                cur_diff = max(1, round(1 + ramp * (self.difficulty - 1)))
-            else:
-                cur_diff = self.difficulty
+                new_diff = max(1, round(1 + ramp * (self.difficulty - 1)))
+                if new_diff != cur_diff:
+                    cur_diff = new_diff
+                    table    = _pool_table(tuple(POOLS[cur_diff]))
+                    gap_min, gap_max = GAPS[cur_diff]
 
             # Pick and place a chunk.
             # Difficulty-2 anti-starvation rule: if we go too long without a
@@ -661,10 +918,10 @@ class LevelGenerator:
             if cur_diff == 2 and chunks_since_double_spike >= 3:
                 chunk_fn = chunk_double_spike
             else:
-                chunk_fn = self._weighted_choice(POOLS[cur_diff])
+                chunk_fn = self._pick(table)
 
-            chunk_objs, width = chunk_fn(x)
-            obstacles.extend(chunk_objs)
+            placed, width = place(chunk_fn, x)
+            yield placed
             x += width
 
             if chunk_fn is chunk_double_spike:
@@ -675,11 +932,33 @@ class LevelGenerator:
                 chunks_since_double_spike = 0
 
             # Add gap before next chunk
-            gap_min, gap_max = GAPS[cur_diff]
-            x += self._rng.randint(gap_min, gap_max)
+            x += self._randint(gap_min, gap_max)
 
-        obstacles.sort(key=lambda o: o["x"])
-        return obstacles
+    def generate_array(self, length: int = 6000) -> np.ndarray:
+        """
+        Same level as generate(length) (same RNG draws), packed into an
+        OBSTACLE_DTYPE record array sorted by x. Game.load_level accepts it
+        directly.
+
+        Built straight from the packed chunk templates — one concatenate per
+        column and one vectorized x offset for the whole level, no obstacle
+        dicts.
+        """
+        placed = list(self._iter_chunks(length, _place_chunk_array))
+        types, terms, rows, offsets = zip(*placed) if placed else ((), (), (), ())
+        arr = np.empty(sum(len(t) for t in types), dtype=OBSTACLE_DTYPE)
+        if len(arr):
+            terms = np.concatenate(terms)
+            rows = np.concatenate(rows)
+            xs = np.repeat(offsets, [len(t) for t in types])
+            for j in range(_X_TERMS):
+                xs += terms[:, j]
+            arr["type"] = np.concatenate(types)
+            arr["x"] = xs
+            arr["y"] = rows[:, 0]
+            arr["w"] = rows[:, 1]
+            arr["h"] = rows[:, 2]
+        return arr
 
     def generate_triple_only(self, length: int = 9000) -> list[dict]:
         """
@@ -700,18 +979,17 @@ class LevelGenerator:
         obstacles: list[dict] = []
 
         # Start offscreen so first obstacle scrolls in naturally.
-        x = float(C.SCREEN_W + C.GAME_SPEED * 1.5)
+        x = _START_X
 
         # Use gap range from GAPS for current difficulty
         gap_min, gap_max = GAPS[self.difficulty]
 
         while x < length + C.SCREEN_W:
-            chunk_objs, width = chunk_triple_spike(x)
+            chunk_objs, width = _place_chunk(chunk_triple_spike, x)
             obstacles.extend(chunk_objs)
             x += width
-            x += self._rng.randint(gap_min, gap_max)
+            x += self._randint(gap_min, gap_max)
 
-        obstacles.sort(key=lambda o: o["x"])
         return obstacles
 
 
@@ -734,18 +1012,17 @@ class LevelGenerator:
         obstacles: list[dict] = []
 
         # Start offscreen so first obstacle scrolls in naturally.
-        x = float(C.SCREEN_W + C.GAME_SPEED * 1.5)
+        x = _START_X
 
         # Use gap range from GAPS for current difficulty
         gap_min, gap_max = GAPS[self.difficulty]
 
         while x < length + C.SCREEN_W:
-            chunk_objs, width = chunk_triple_spike(x)
+            chunk_objs, width = _place_chunk(chunk_triple_spike, x)
             obstacles.extend(chunk_objs)
             x += width
-            x += self._rng.randint(gap_min, gap_max)
+            x += self._randint(gap_min, gap_max)
 
-        obstacles.sort(key=lambda o: o["x"])
         return obstacles
 
     def generate_staircase_only(self, length: int = 9000) -> list[dict]:
@@ -776,7 +1053,7 @@ class LevelGenerator:
             chunk_staircase_up_with_spike,
         ]
 
-        x = float(C.SCREEN_W + C.GAME_SPEED * 1.5)  # Start offscreen
+        x = _START_X  # Start offscreen
         pattern_idx = 0
 
         while x < length + C.SCREEN_W:
@@ -784,15 +1061,14 @@ class LevelGenerator:
             chunk_fn = staircase_pool[pattern_idx % len(staircase_pool)]
             pattern_idx += 1
 
-            chunk_objs, width = chunk_fn(x)
+            chunk_objs, width = _place_chunk(chunk_fn, x)
             obstacles.extend(chunk_objs)
             x += width
 
             # Small gap between staircases (0.3s–0.5s)
-            gap = self._rng.randint(int(0.3 * C.GAME_SPEED), int(0.5 * C.GAME_SPEED))
+            gap = self._randint(int(0.3 * C.GAME_SPEED), int(0.5 * C.GAME_SPEED))
             x += gap
 
-        obstacles.sort(key=lambda o: o["x"])
         return obstacles
 
     def generate_rhythm_only(self, length: int = 9000) -> list[dict]:
@@ -811,16 +1087,15 @@ class LevelGenerator:
             chunk_flat_ground,
         ]
 
-        x = float(C.SCREEN_W + C.GAME_SPEED * 1.5)
+        x = _START_X
 
         while x < length + C.SCREEN_W:
-            chunk_fn = self._rng.choice(rhythm_pool)
-            chunk_objs, width = chunk_fn(x)
+            chunk_fn = self._choice(rhythm_pool)
+            chunk_objs, width = _place_chunk(chunk_fn, x)
             obstacles.extend(chunk_objs)
             x += width
-            x += self._rng.randint(int(0.5 * C.GAME_SPEED), int(0.9 * C.GAME_SPEED))
+            x += self._randint(int(0.5 * C.GAME_SPEED), int(0.9 * C.GAME_SPEED))
 
-        obstacles.sort(key=lambda o: o["x"])
         return obstacles
 
     def generate_spike_only(self, length: int = 9000) -> list[dict]:
@@ -831,37 +1106,55 @@ class LevelGenerator:
         comparisons on spike handling.
         """
         obstacles: list[dict] = []
-        spike_pool = [
-            chunk_single_spike,
-            chunk_double_spike,
-            chunk_triple_spike,
-            chunk_spike_gate,
-            chunk_alternating_spikes,
-            chunk_spike_cluster,
-            chunk_triple_then_single,
-        ]
 
-        x = float(C.SCREEN_W + C.GAME_SPEED * 1.5)
+        x = _START_X
+        table = _pool_table(tuple(SPIKE_ONLY_POOL))
 
         while x < length + C.SCREEN_W:
-            chunk_fn = self._weighted_choice([(fn, 1) for fn in spike_pool])
-            chunk_objs, width = chunk_fn(x)
+            chunk_fn = self._pick(table)
+            chunk_objs, width = _place_chunk(chunk_fn, x)
             obstacles.extend(chunk_objs)
             x += width
-            x += self._rng.randint(int(0.45 * C.GAME_SPEED), int(0.8 * C.GAME_SPEED))
+            x += self._randint(int(0.45 * C.GAME_SPEED), int(0.8 * C.GAME_SPEED))
 
-        obstacles.sort(key=lambda o: o["x"])
         return obstacles
 
+    def _uniform(self) -> float:
+        """Next float in [0, 1) from the batched PCG64 buffer (rng_kind="pcg64")."""
+        if self._u_idx == len(self._u_buf):
+            self._u_buf = self._np_rng.random(_RNG_BATCH).tolist()
+            self._u_idx = 0
+        u = self._u_buf[self._u_idx]
+        self._u_idx += 1
+        return u
+
+    def _randint(self, lo: int, hi: int) -> int:
+        """Uniform integer in [lo, hi] from the stream selected by rng_kind."""
+        if self._np_rng is None:
+            return self._rng.randint(lo, hi)
+        return lo + int(self._uniform() * (hi - lo + 1))
+
+    def _choice(self, seq: list) -> object:
+        """Uniform pick from `seq` from the stream selected by rng_kind."""
+        if self._np_rng is None:
+            return self._rng.choice(seq)
+        return seq[int(self._uniform() * len(seq))]
+
     def _weighted_choice(self, pool: list[tuple]) -> object:
-        fns, weights = zip(*pool)
-        total = sum(weights)
-        r = self._rng.randint(1, total)
-        cumulative = 0
-        for fn, w in zip(fns, weights):
-            cumulative += w
-            if r <= cumulative:
-                return fn
+        """Weighted pick of a chunk function from a (chunk_fn, weight) pool."""
+        return self._pick(_pool_table(tuple(pool)))
+
+    def _pick(self, table: tuple) -> object:
+        """Weighted pick from a _pool_table() table, on the rng_kind stream."""
+        fns, cumulative, prob, alias = table
+        if self._np_rng is None:
+            # First entry whose cumulative weight reaches r (r in 1..total)
+            return fns[bisect_left(cumulative, self._rng.randint(1, cumulative[-1]))]
+        # Alias draw from a single uniform: integer part picks the column,
+        # fractional part decides between it and its alias.
+        u = self._uniform() * len(fns)
+        i = int(u)
+        return fns[i] if u - i < prob[i] else fns[alias[i]]
 # =============================================================================
 # Preview entry point
 # =============================================================================
@@ -902,9 +1195,7 @@ def main() -> None:
         obstacles = gen.generate(length=args.length)
 
     # Print summary
-    types: dict[str, int] = {}
-    for o in obstacles:
-        types[o["type"]] = types.get(o["type"], 0) + 1
+    types = dict(Counter(o["type"] for o in obstacles))
     print(f"\nDifficulty {args.diff} | seed={args.seed} | "
           f"progressive={args.progressive} | length={args.length}px "
           f"({args.length / C.GAME_SPEED:.0f}s)")
@@ -916,20 +1207,21 @@ def main() -> None:
         game.toggle_telemetry()
     game.load_level(obstacles)
 
-    attempts = 0
-    best     = 0
-    running  = True
+    attempts  = 0
+    best      = 0
+    running   = True
+    jump_held = False   # SPACE/UP is down; tracked from KEYDOWN/KEYUP events
 
     while running:
         dt     = game.tick()
-        action = 0
+        tapped = False   # a jump key went down this frame, even if already released
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key in (pygame.K_SPACE, pygame.K_UP):
-                    action = 1
+                    jump_held = tapped = True
                 elif event.key == pygame.K_r:
                     game.load_level(obstacles)
                     attempts += 1
@@ -939,11 +1231,16 @@ def main() -> None:
                     game.toggle_telemetry()
                 elif event.key in (pygame.K_q, pygame.K_ESCAPE):
                     running = False
-
-        # Also respond to held key for smoother feel
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_SPACE] or keys[pygame.K_UP]:
-            action = 1
+            elif event.type == pygame.KEYUP:
+                if event.key in (pygame.K_SPACE, pygame.K_UP):
+                    jump_held = False
+            elif event.type == pygame.WINDOWFOCUSLOST or (
+                    event.type == pygame.ACTIVEEVENT and not event.gain
+                    and event.state & pygame.APPINPUTFOCUS):
+                # The KEYUP goes to whichever window has focus — don't stick
+                jump_held = False
+
+        action = 1 if jump_held or tapped else 0
 
         obs, reward, done = game.step(action, dt)
         game.render()
@@ -0,0 +1,307 @@
+# =============================================================================
+# test_level_generator.py
+# =============================================================================
+# Regression tests for level_generator.py: seeded levels are checked against
+# a reference copy of the original generator loop, so any change to chunk
+# placement or RNG use that alters the levels a seed produces shows up here
+# instead of silently in training.
+#
+# Usage:
+#   python -m pytest -q test_level_generator.py
+#
+# =============================================================================
+
+import random
+
+import numpy as np
+import pytest
+
+import constants as C
+import level_generator as L
+from level_generator import LevelGenerator
+
+
+# ── Reference generator ──────────────────────────────────────────────────────
+# The original generate()/generate_*_only() loops: chunk_fn(x) called
+# directly, integer weighted picks, one stable sort by x at the end.
+
+def _baseline_weighted_choice(rng: random.Random, pool: list[tuple]):
+    fns, weights = zip(*pool)
+    r = rng.randint(1, sum(weights))
+    cumulative = 0
+    for fn, w in zip(fns, weights):
+        cumulative += w
+        if r <= cumulative:
+            return fn
+
+
+def _baseline_level(method: str, difficulty: int, seed: int, progressive: bool, length: int) -> list[dict]:
+    rng = random.Random(seed)
+    obstacles: list[dict] = []
+    x = float(C.SCREEN_W + C.GAME_SPEED * 1.5)
+    chunks_since_double_spike = 0
+    staircase_pool = [L.chunk_staircase_up, L.chunk_staircase_up_wide,
+                      L.chunk_staircase_double, L.chunk_staircase_up_with_spike]
+    rhythm_pool = [L.chunk_spike_gate, L.chunk_alternating_spikes, L.chunk_spike_then_platform,
+                   L.chunk_spike_cluster, L.chunk_flat_ground]
+    spike_pool = [L.chunk_single_spike, L.chunk_double_spike, L.chunk_triple_spike, L.chunk_spike_gate,
+                  L.chunk_alternating_spikes, L.chunk_spike_cluster, L.chunk_triple_then_single]
+    pattern_idx = 0
+
+    while x < length + C.SCREEN_W:
+        if method == "generate":
+            if progressive:
+                ramp = min(min((x - C.SCREEN_W) / length, 1.0) / 0.7, 1.0)
+                cur_diff = max(1, round(1 + ramp * (difficulty - 1)))
+            else:
+                cur_diff = difficulty
+            if cur_diff == 2 and chunks_since_double_spike >= 3:
+                chunk_fn = L.chunk_double_spike
+            else:
+                chunk_fn = _baseline_weighted_choice(rng, L.POOLS[cur_diff])
+            if chunk_fn is L.chunk_double_spike:
+                chunks_since_double_spike = 0
+            elif cur_diff == 2:
+                chunks_since_double_spike += 1
+            else:
+                chunks_since_double_spike = 0
+            gap = L.GAPS[cur_diff]
+        elif method == "generate_triple_only":
+            chunk_fn, gap = L.chunk_triple_spike, L.GAPS[difficulty]
+        elif method == "generate_staircase_only":
+            chunk_fn = staircase_pool[pattern_idx % len(staircase_pool)]
+            pattern_idx += 1
+            gap = (int(0.3 * C.GAME_SPEED), int(0.5 * C.GAME_SPEED))
+        elif method == "generate_rhythm_only":
+            chunk_fn = rng.choice(rhythm_pool)
+            gap = (int(0.5 * C.GAME_SPEED), int(0.9 * C.GAME_SPEED))
+        else:
+            chunk_fn = _baseline_weighted_choice(rng, [(fn, 1) for fn in spike_pool])
+            gap = (int(0.45 * C.GAME_SPEED), int(0.8 * C.GAME_SPEED))
+
+        chunk_objs, width = chunk_fn(x)
+        obstacles.extend(chunk_objs)
+        x += width
+        x += rng.randint(*gap)
+
+    obstacles.sort(key=lambda o: o["x"])
+    return obstacles
+
+
+SPECIAL_METHODS = ["generate_triple_only", "generate_staircase_only",
+                   "generate_rhythm_only", "generate_spike_only"]
+
+
+@pytest.mark.parametrize("difficulty", range(1, 7))
+@pytest.mark.parametrize("progressive", [False, True])
+def test_generate_matches_baseline(difficulty, progressive):
+    for seed in (0, 7, 42):
+        level = LevelGenerator(difficulty, seed=seed, progressive=progressive).generate(18000)
+        assert level == _baseline_level("generate", difficulty, seed, progressive, 18000), seed
+
+
+@pytest.mark.parametrize("method", SPECIAL_METHODS)
+def test_special_modes_match_baseline(method):
+    for difficulty in (1, 3, 5):
+        for seed in range(5):
+            level = getattr(LevelGenerator(difficulty, seed=seed), method)(9000)
+            assert level == _baseline_level(method, difficulty, seed, False, 9000), (difficulty, seed)
+
+
+def test_level_start():
+    level = LevelGenerator(difficulty=3, seed=42).generate(length=3000)
+    assert [(o["type"], o["x"]) for o in level][:2] == [
+        ("spike", 3664.83456336), ("spike", 3776.83456336),
+    ]
+
+
+def test_place_chunk_matches_chunk_fn():
+    """Template placement must equal calling the chunk, for any x."""
+    rng = random.Random(0)
+    for chunk_fn in sorted(L._TEMPLATE_CHUNKS, key=lambda fn: fn.__name__):
+        for _ in range(500):
+            x = rng.choice((rng.uniform(0.0, 40000.0), float(rng.randint(0, 40000))))
+            assert L._place_chunk(chunk_fn, x) == chunk_fn(x), (chunk_fn.__name__, x)
+        # A fractional x where x + (a + b) rounds differently from (x + a) + b
+        assert L._place_chunk(chunk_fn, 168.0574) == chunk_fn(168.0574)
+
+
+# ── Packed form ──────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("difficulty", range(1, 7))
+@pytest.mark.parametrize("progressive", [False, True])
+def test_generate_array_matches_generate(difficulty, progressive):
+    for seed in range(5):
+        arr = LevelGenerator(difficulty, seed=seed, progressive=progressive).generate_array(9000)
+        dicts = LevelGenerator(difficulty, seed=seed, progressive=progressive).generate(9000)
+        assert arr.dtype == L.OBSTACLE_DTYPE
+        assert arr.tobytes() == L.obstacles_to_array(dicts).tobytes()
+
+
+def test_place_chunk_array_matches_chunk_fn():
+    for chunk_fn in sorted(L._TEMPLATE_CHUNKS, key=lambda fn: fn.__name__):
+        for x in (168.0574, L._START_X):
+            (types, terms, rows, offset), width = L._place_chunk_array(chunk_fn, x)
+            objs, expected_width = chunk_fn(x)
+            packed = L.obstacles_to_array(objs)
+            xs = np.full(len(types), offset)
+            for j in range(terms.shape[1]):
+                xs += terms[:, j]
+            assert width == expected_width
+            assert types.tolist() == packed["type"].tolist()
+            assert xs.tolist() == packed["x"].tolist()
+            assert rows.tolist() == np.column_stack((packed["y"], packed["w"], packed["h"])).tolist()
+
+
+def test_template_chunks_are_listed_explicitly():
+    # A chunk outside _TEMPLATE_CHUNKS (e.g. user-added) is called directly.
+    calls = []
+
+    def chunk_custom(x):
+        calls.append(x)
+        return [L._spike(x)], float(L.B)
+
+    assert L._place_chunk(chunk_custom, 100.5) == ([L._spike(100.5)], float(L.B))
+    (types, terms, rows, offset), width = L._place_chunk_array(chunk_custom, 100.5)
+    assert calls == [100.5, 100.5]
+    assert offset + terms[0, 0] == 100.5
+
+
+def test_unknown_types_are_skipped_consistently():
+    from game import Game
+
+    level = LevelGenerator(difficulty=3, seed=1).generate(6000)
+    noisy = list(level)
+    noisy.insert(3, {"type": "coin", "x": noisy[3]["x"], "y": 0.0, "w": 10.0, "h": 10.0})
+
+    arr = L.obstacles_to_array(noisy)
+    assert arr.tobytes() == L.obstacles_to_array(level).tobytes()
+
+    from_dicts, from_array = Game(render=False), Game(render=False)
+    from_dicts.load_level(noisy)
+    from_array.load_level(arr)
+    assert from_dicts._obs_x.tolist() == from_array._obs_x.tolist()
+    assert from_dicts._obs_kind.tolist() == from_array._obs_kind.tolist()
+
+
+# ── rng_kind ─────────────────────────────────────────────────────────────────
+
+SPECIAL_MODES = ["generate_triple_only", "generate_staircase_only",
+                 "generate_rhythm_only", "generate_spike_only"]
+
+
+def test_legacy_is_the_default():
+    for seed in (0, 42):
+        default = LevelGenerator(difficulty=4, seed=seed).generate(9000)
+        legacy = LevelGenerator(difficulty=4, seed=seed, rng_kind="legacy").generate(9000)
+        assert default == legacy
+
+
+@pytest.mark.parametrize("method", ["generate", *SPECIAL_MODES])
+def test_pcg64_is_deterministic_per_seed(method):
+    def level(seed):
+        return getattr(LevelGenerator(difficulty=4, seed=seed, rng_kind="pcg64"), method)(length=18000)
+
+    assert level(3) == level(3)
+    assert level(3) != level(4)
+    assert level(3) != getattr(LevelGenerator(difficulty=4, seed=3), method)(length=18000)
+
+
+@pytest.mark.parametrize("method", ["generate", *SPECIAL_MODES])
+def test_pcg64_never_touches_the_legacy_stream(method):
+    gen = LevelGenerator(difficulty=4, seed=5, rng_kind="pcg64")
+    state = gen._rng.getstate()
+    getattr(gen, method)(length=18000)
+    assert gen._rng.getstate() == state
+
+
+@pytest.mark.parametrize("rng_kind", ["legacy", "pcg64"])
+def test_randint_bounds_are_inclusive(rng_kind):
+    gen = LevelGenerator(seed=0, rng_kind=rng_kind)
+    draws = [gen._randint(3, 7) for _ in range(5 * L._RNG_BATCH)]   # spans several refills
+    assert set(draws) == {3, 4, 5, 6, 7}
+    assert all(gen._randint(9, 9) == 9 for _ in range(10))
+
+
+def test_uniform_batches_are_one_stream():
+    """Batched draws must equal the PCG64 stream read one value at a time."""
+    gen = LevelGenerator(seed=11, rng_kind="pcg64")
+    n = 3 * L._RNG_BATCH + 5
+    assert [gen._uniform() for _ in range(n)] == np.random.default_rng(11).random(n).tolist()
+
+
+def test_rejects_unknown_rng_kind():
+    with pytest.raises(ValueError):
+        LevelGenerator(rng_kind="mt")
+
+
+# ── Pool sampling ────────────────────────────────────────────────────────────
+
+def _expected_frequencies(pool):
+    total = sum(w for _, w in pool)
+    expected = {}
+    for fn, w in pool:   # a function may appear twice (POOL_2's spike gate)
+        expected[fn] = expected.get(fn, 0.0) + w / total
+    return expected
+
+
+@pytest.mark.parametrize("rng_kind", ["legacy", "pcg64"])
+@pytest.mark.parametrize("pool", [L.POOL_2, L.POOL_5, L.SPIKE_ONLY_POOL], ids=["pool2", "pool5", "spike_only"])
+def test_weighted_choice_frequencies(rng_kind, pool):
+    gen = LevelGenerator(seed=123, rng_kind=rng_kind)
+    n = 200_000
+    counts = {}
+    for _ in range(n):
+        fn = gen._weighted_choice(pool)
+        counts[fn] = counts.get(fn, 0) + 1
+    expected = _expected_frequencies(pool)
+    assert set(counts) <= set(expected)
+    for fn, p in expected.items():
+        assert abs(counts.get(fn, 0) / n - p) < 0.005, fn.__name__
+
+
+def test_in_place_pool_edits_take_effect():
+    pool = L.POOLS[3]
+    original = list(pool)
+    LevelGenerator(difficulty=3, seed=0).generate(3000)   # tables the original contents
+    try:
+        pool[:] = [(L.chunk_flat_ground, 1)]               # documented way to tune a pool
+        gen = LevelGenerator(difficulty=3, seed=0)
+        assert all(gen._weighted_choice(pool) is L.chunk_flat_ground for _ in range(50))
+        assert gen.generate(9000) == []
+    finally:
+        pool[:] = original
+
+
+def test_ad_hoc_pools_are_tabled_once():
+    pool = [(L.chunk_single_spike, 1), (L.chunk_double_spike, 3)]
+    assert L._pool_table(tuple(pool)) is L._pool_table(tuple(list(pool)))
+
+
+# ── iter_obstacles ───────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("rng_kind", ["legacy", "pcg64"])
+@pytest.mark.parametrize("progressive", [False, True])
+def test_iter_obstacles_matches_generate(rng_kind, progressive):
+    for difficulty in range(1, 7):
+        def gen():
+            return LevelGenerator(difficulty, seed=9, progressive=progressive, rng_kind=rng_kind)
+        a, b = gen(), gen()
+        assert list(a.iter_obstacles(12000)) == b.generate(12000)
+        assert a._rng.getstate() == b._rng.getstate()          # same draws, in full
+        if rng_kind == "pcg64":
+            assert a._u_idx == b._u_idx
+            assert a._np_rng.bit_generator.state == b._np_rng.bit_generator.state
+
+
+def test_iter_obstacles_draws_lazily():
+    lazy, manual = LevelGenerator(3, seed=4), LevelGenerator(3, seed=4)
+    untouched = lazy._rng.getstate()
+
+    it = lazy.iter_obstacles(9000)
+    assert lazy._rng.getstate() == untouched                   # nothing drawn before the first next()
+
+    first = next(it)
+    first_chunk_fn = manual._weighted_choice(L.POOLS[3])        # exactly one chunk pick so far
+    assert lazy._rng.getstate() == manual._rng.getstate()
+    assert first == L._place_chunk(first_chunk_fn, L._START_X)[0][0]
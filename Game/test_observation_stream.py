@@ -10,6 +10,8 @@
 #
 # =============================================================================
 
+import numpy as np
+
 from level_generator import LevelGenerator
 from game import Game
 
@@ -71,3 +73,35 @@ def test_observation_streaming():
 
 if __name__ == "__main__":
     test_observation_streaming()
+
+
+def _flatten(obs_dict):
+    return [obs_dict["player_y"], obs_dict["player_vy"], obs_dict["on_ground"], *obs_dict["obstacles"]]
+
+
+def test_array_obs_matches_dict_obs():
+    """obs_mode="array" is the dict observation flattened, refilled in one buffer."""
+    level = LevelGenerator(difficulty=3, seed=7).generate(length=9000)
+    for make_level in (True, False):
+        dict_game = Game(render=False, seed=3)
+        array_game = Game(render=False, seed=3, obs_mode="array")
+        if make_level:
+            obs_d, obs_a = dict_game.load_level(level), array_game.load_level(level)
+        else:
+            obs_d, obs_a = dict_game.reset(), array_game.reset()
+        buf = obs_a
+        assert buf.shape == (28,) and buf.dtype == np.float32
+
+        for step in range(800):
+            assert obs_a is buf                     # same preallocated vector every time
+            np.testing.assert_array_equal(obs_a, np.asarray(_flatten(obs_d), dtype=np.float32))
+            norm_d = dict_game.get_normalized_observation()
+            assert len(norm_d) == 28
+            assert array_game.get_normalized_observation() == norm_d
+
+            action = 1 if step % 25 == 0 else 0
+            obs_d, reward_d, done_d = dict_game.step(action)
+            obs_a, reward_a, done_a = array_game.step(action)
+            assert (reward_d, done_d) == (reward_a, done_a)
+            if done_d:
+                obs_d, obs_a = dict_game.reset(), array_game.reset()
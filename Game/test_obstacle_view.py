@@ -0,0 +1,52 @@
+# =============================================================================
+# test_obstacle_view.py
+# =============================================================================
+# Game keeps obstacles in NumPy arrays; `Game.obstacles` is a lazily built
+# Spike/Block view of them for rendering and debugging. These tests check
+# that the view tracks the arrays and that pooled objects stay per game.
+#
+# Usage:
+#   python -m pytest -q test_obstacle_view.py
+#
+# =============================================================================
+
+from game import Game
+from level_generator import LevelGenerator
+
+
+def test_pools_are_per_game():
+    a = Game(render=False, seed=1)
+    b = Game(render=False, seed=2)
+    held = list(a.obstacles)
+    snapshot = [(o.kind, o.x, o._y) for o in held]
+
+    a.reset()                  # releases a's objects into a's pool
+    b_objs = list(b.obstacles)
+
+    assert not {id(o) for o in held} & {id(o) for o in b_objs}
+    assert [(o.kind, o.x, o._y) for o in held] == snapshot
+
+
+def _view_rows(game):
+    return [(o.kind, o.x, o._y, o.w, o.h) for o in game.obstacles]
+
+
+def _array_rows(game):
+    kind, xs, ys, ws, hs = game.obstacle_arrays()
+    names = {0: "spike", 1: "block"}
+    return [(names[k], x, y, w, h) for k, x, y, w, h in
+            zip(kind.tolist(), xs.tolist(), ys.tolist(), ws.tolist(), hs.tolist())]
+
+
+def test_view_tracks_arrays_across_steps_and_resets():
+    fixed = Game(render=False, seed=3)
+    fixed.load_level(LevelGenerator(difficulty=3, seed=5).generate(length=6000))
+    for game in (fixed, Game(render=False, seed=3)):
+        for step in range(600):
+            if step % 7 == 0:
+                assert _view_rows(game) == _array_rows(game)
+                assert _view_rows(game) == _array_rows(game)   # re-read, no step in between
+            _, _, done = game.step(1 if step % 40 == 0 else 0)
+            if done:
+                game.reset()
+                assert _view_rows(game) == _array_rows(game)
@@ -0,0 +1,97 @@
+# =============================================================================
+# test_physics_paths.py
+# =============================================================================
+# Game.step() has two implementations of the per-frame physics: the
+# collision_nb.step_core kernel (used when Numba is available) and the NumPy
+# path (Player.jump/update + Game._check_collision/_mark_passed). Training
+# and rendering may run on different paths, so they must stay bit-identical.
+#
+# Usage:
+#   python -m pytest -q test_physics_paths.py
+#
+# =============================================================================
+
+import random
+
+import pytest
+
+import constants as C
+import game as game_module
+from game import Game
+from level_generator import LevelGenerator
+
+
+def _policy(rng: random.Random, obs: dict, lookahead: float) -> int:
+    """Jump (mostly) when the next obstacle is close, plus the odd random jump."""
+    obstacles = obs["obstacles"]
+    for k in range(0, len(obstacles), 5):
+        x, w = obstacles[k + 1], obstacles[k + 3]
+        if w == 0.0:
+            break
+        if x + w >= C.PLAYER_X:
+            gap = x - (C.PLAYER_X + C.PLAYER_SIZE)
+            if 0.0 <= gap < lookahead and rng.random() < 0.9:
+                return 1
+            break
+    return 1 if rng.random() < 0.03 else 0
+
+
+def _rollout(make_game, use_kernel: bool, n_steps: int, action_seed: int) -> list:
+    """Step a fresh game with a seeded scripted policy; record everything observable."""
+    saved = game_module.NUMBA_AVAILABLE
+    game_module.NUMBA_AVAILABLE = use_kernel   # step() reads the module global
+    try:
+        game = make_game()
+        obs = game.reset()
+        rng = random.Random(action_seed)
+        lookahead = rng.choice((60.0, 120.0, 200.0))
+        trace = []
+        for _ in range(n_steps):
+            obs, reward, done = game.step(_policy(rng, obs, lookahead))
+            p = game.player
+            trace.append((
+                obs["player_y"], obs["player_vy"], obs["on_ground"], tuple(obs["obstacles"]),
+                reward, done,
+                p.y, p.vy, p.last_y, p.on_ground, p.alive, p.angle,
+                game._collision_idx, game._obs_x.tolist(), game._obs_cleared.tolist(),
+            ))
+            if done:
+                obs = game.reset()
+        return trace
+    finally:
+        game_module.NUMBA_AVAILABLE = saved
+
+
+def _procedural(seed):
+    return lambda: Game(render=False, seed=seed)
+
+
+def _fixed(difficulty, seed, mode="generate"):
+    level = getattr(LevelGenerator(difficulty=difficulty, seed=seed), mode)(length=9000)
+
+    def make():
+        game = Game(render=False, seed=0)
+        game.load_level(level)
+        return game
+    return make
+
+
+@pytest.mark.parametrize("make_game", [
+    _procedural(0), _procedural(7),
+    _fixed(1, 42), _fixed(3, 5), _fixed(5, 11),
+    _fixed(3, 2, "generate_staircase_only"),
+], ids=["proc-0", "proc-7", "fixed-d1", "fixed-d3", "fixed-d5", "stairs"])
+@pytest.mark.parametrize("action_seed", [1, 2, 3])
+def test_kernel_matches_numpy_path(make_game, action_seed):
+    kernel = _rollout(make_game, True, 3000, action_seed)
+    numpy_ = _rollout(make_game, False, 3000, action_seed)
+    for i, (a, b) in enumerate(zip(kernel, numpy_)):
+        assert a == b, f"paths diverge at step {i}"
+
+
+def test_rollouts_exercise_landings_and_deaths():
+    """The scripted policy must land on blocks and die, or the test above proves little."""
+    trace = _rollout(_fixed(3, 2, "generate_staircase_only"), True, 3000, 1)
+    ground_top = float(C.GROUND_Y - C.PLAYER_SIZE)
+    assert sum(1 for step in trace if step[9] and step[6] < ground_top) > 20
+    assert sum(1 for step in trace if step[5]) > 5
@@ -0,0 +1,78 @@
+# =============================================================================
+# test_vec_game.py
+# =============================================================================
+# VecGame must behave exactly like n independent Game(obs_mode="array")
+# worlds stepped one by one, with SB3-style auto-reset on done.
+#
+# Usage:
+#   python -m pytest -q test_vec_game.py
+#
+# =============================================================================
+
+import numpy as np
+import pytest
+
+from game import Game, VecGame
+
+
+def _actions(n_envs: int, n_steps: int) -> np.ndarray:
+    return (np.random.default_rng(0).random((n_steps, n_envs)) < 0.1).astype(np.int64)
+
+
+def test_matches_independent_games():
+    n_envs, n_steps = 4, 600
+    vg = VecGame(n_envs, seed=10)
+    solo = [Game(render=False, seed=10 + i, obs_mode="array") for i in range(n_envs)]
+
+    obs = vg.reset()
+    assert obs.shape == (n_envs, Game.OBS_DIM) and obs.dtype == np.float32
+    for i, game in enumerate(solo):
+        np.testing.assert_array_equal(obs[i], game.reset())
+
+    n_done = 0
+    for actions in _actions(n_envs, n_steps):
+        obs, rewards, dones, infos = vg.step(actions)
+        assert len(infos) == n_envs
+        for i, game in enumerate(solo):
+            o, r, d = game.step(int(actions[i]))
+            assert rewards[i] == np.float32(r) and dones[i] == d
+            if d:
+                n_done += 1
+                np.testing.assert_array_equal(infos[i]["terminal_observation"], o)
+                o = game.reset()
+            else:
+                assert "terminal_observation" not in infos[i]
+            np.testing.assert_array_equal(obs[i], o)
+    assert n_done > 0, "rollout should include deaths"
+
+
+def test_terminal_observation_is_a_copy():
+    vg = VecGame(2, seed=0)
+    vg.reset()
+    for _ in range(2000):
+        obs, _, dones, infos = vg.step([1, 1])
+        if dones.any():
+            i = int(np.flatnonzero(dones)[0])
+            terminal = infos[i]["terminal_observation"]
+            assert terminal is not obs[i] and not np.shares_memory(terminal, obs)
+            return
+    pytest.fail("no world died")
+
+
+def test_obs_out_is_filled_in_place():
+    buf = np.full(Game.OBS_DIM, np.nan, dtype=np.float32)
+    game = Game(render=False, seed=1, obs_mode="array", obs_out=buf)
+    assert not np.isnan(buf).any()          # valid from construction
+    obs, _, _ = game.step(0)
+    assert obs is buf
+    assert game.reset() is buf
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"obs_mode": "dict", "obs_out": np.zeros(Game.OBS_DIM, dtype=np.float32)},
+    {"obs_mode": "array", "obs_out": np.zeros(Game.OBS_DIM, dtype=np.float64)},
+    {"obs_mode": "array", "obs_out": np.zeros(Game.OBS_DIM + 1, dtype=np.float32)},
+])
+def test_obs_out_validation(kwargs):
+    with pytest.raises(ValueError):
+        Game(render=False, **kwargs)